@@ -56,7 +56,7 @@ from datetime import date as dt_date
 from database.sqlite_manager import SQLiteManager
 from core.opc_handler import OPCHandler
 from core.rrule_parser import RRuleParser
-from core.schedule_resolver import resolve_occurrences_for_range
+from core.schedule_resolver import group_occurrences_by_date, resolve_occurrences_for_range
 from ui.recurrence_dialog import RecurrenceDialog
 from ui.database_settings_dialog import DatabaseSettingsDialog
 from ui.holiday_settings_dialog import HolidaySettingsDialog
@@ -66,6 +66,21 @@ from ui.month_grid import MonthViewWidget
 from core.lunar_calendar import to_lunar, format_lunar_day_text
 from ui.app_icon import get_app_icon
 
+# 切換日期/視圖時保留的 occurrence 快取筆數上限
+_OCCURRENCE_CACHE_LIMIT = 32
+
+# 左側導覽月曆每格重繪都會用到的顏色，共用同一組 QColor 不逐格建立
+_NAV_CELL_BG_DARK = QColor("#2b2b2b")
+_NAV_CELL_BG_LIGHT = QColor("#ffffff")
+_NAV_HOLIDAY_FG = QColor("#c62828")
+_NAV_DAY_FG_DARK = QColor("#f0f0f0")
+_NAV_DAY_FG_LIGHT = QColor("#202020")
+_NAV_OTHER_MONTH_HOLIDAY_FG = QColor("#b36b6b")
+_NAV_OTHER_MONTH_FG = QColor("#808080")
+_NAV_TODAY_PEN = QColor("#ff8f00")
+_NAV_SELECTED_BG_DARK = QColor("#2e7d32")
+_NAV_SELECTED_BG_LIGHT = QColor("#66bb6a")
+
 
 class NavCalendarWidget(QCalendarWidget):
     """
@@ -169,7 +184,7 @@ class NavCalendarWidget(QCalendarWidget):
 
         painter.save()
         # 底色
-        cell_bg = QColor("#2b2b2b") if self._is_dark_theme else QColor("#ffffff")
+        cell_bg = _NAV_CELL_BG_DARK if self._is_dark_theme else _NAV_CELL_BG_LIGHT
         painter.fillRect(rect, cell_bg)
 
         # 決定這格是否完全不顯示（空白）
@@ -194,11 +209,11 @@ class NavCalendarWidget(QCalendarWidget):
             is_holiday = self._is_holiday(date)
             if is_this:
                 if is_holiday:
-                    day_fg = QColor("#c62828")
+                    day_fg = _NAV_HOLIDAY_FG
                 else:
-                    day_fg = QColor("#f0f0f0") if is_dark_palette else QColor("#202020")
+                    day_fg = _NAV_DAY_FG_DARK if is_dark_palette else _NAV_DAY_FG_LIGHT
             else:
-                day_fg = QColor("#b36b6b") if is_holiday else QColor("#808080")
+                day_fg = _NAV_OTHER_MONTH_HOLIDAY_FG if is_holiday else _NAV_OTHER_MONTH_FG
 
             # 上方：國曆（較大）
             painter.setPen(day_fg)
@@ -222,15 +237,14 @@ class NavCalendarWidget(QCalendarWidget):
 
             # 今日標記（左側小月曆永久保留一個 today 高亮）
             if date == QDate.currentDate():
-                today_pen = QColor("#ff8f00")
-                painter.setPen(today_pen)
+                painter.setPen(_NAV_TODAY_PEN)
                 painter.setBrush(Qt.NoBrush)
                 today_rect = rect.adjusted(3, 3, -3, -3)
                 painter.drawRect(today_rect)
 
         # 畫選取高亮（兩個小月曆共用同一個選取日期；但隱藏格不畫）
         if (not hide) and self._forced_selected_date and date == self._forced_selected_date:
-            sel = QColor("#2e7d32") if is_dark_palette else QColor("#66bb6a")
+            sel = _NAV_SELECTED_BG_DARK if is_dark_palette else _NAV_SELECTED_BG_LIGHT
             painter.setPen(Qt.NoPen)
             painter.setBrush(sel)
             r = rect.adjusted(2, 2, -2, -2)
@@ -238,11 +252,11 @@ class NavCalendarWidget(QCalendarWidget):
             is_holiday = self._is_holiday(date)
             if is_this:
                 if is_holiday:
-                    selected_day_fg = QColor("#c62828")
+                    selected_day_fg = _NAV_HOLIDAY_FG
                 else:
-                    selected_day_fg = QColor("#f0f0f0") if is_dark_palette else QColor("#202020")
+                    selected_day_fg = _NAV_DAY_FG_DARK if is_dark_palette else _NAV_DAY_FG_LIGHT
             else:
-                selected_day_fg = QColor("#b36b6b") if is_holiday else QColor("#808080")
+                selected_day_fg = _NAV_OTHER_MONTH_HOLIDAY_FG if is_holiday else _NAV_OTHER_MONTH_FG
             painter.setPen(selected_day_fg)
 
             solar_font = QFont(painter.font())
@@ -445,25 +459,24 @@ class ScheduleLoadWorker(QThread):
 
     @staticmethod
     def _build_view_range(view_mode: str, reference_date: QDate) -> tuple[Optional[datetime], Optional[datetime]]:
-        start: Optional[datetime] = None
-        end: Optional[datetime] = None
-
+        # 直接以 Python date 計算範圍，避免多次 QDate 往返
+        ref = reference_date.toPython()
         if view_mode == "day":
-            start = datetime(reference_date.year(), reference_date.month(), reference_date.day())
-            end = start + timedelta(days=1)
+            range_start = ref
+            days = 1
         elif view_mode == "week":
-            week_start = reference_date.addDays(-(reference_date.dayOfWeek() - 1))
-            week_end = week_start.addDays(7)
-            start = datetime(week_start.year(), week_start.month(), week_start.day())
-            end = datetime(week_end.year(), week_end.month(), week_end.day())
+            # 與週檢視相同以週日為一週起點（weekday(): 週一=0 … 週日=6）
+            range_start = ref - timedelta(days=(ref.weekday() + 1) % 7)
+            days = 7
         elif view_mode == "month":
-            first = QDate(reference_date.year(), reference_date.month(), 1)
-            days_to_sunday = first.dayOfWeek() % 7
-            grid_start = first.addDays(-days_to_sunday)
-            grid_end = grid_start.addDays(42)
-            start = datetime(grid_start.year(), grid_start.month(), grid_start.day())
-            end = datetime(grid_end.year(), grid_end.month(), grid_end.day())
+            first = ref.replace(day=1)
+            range_start = first - timedelta(days=(first.weekday() + 1) % 7)
+            days = 42
+        else:
+            return None, None
 
+        start = datetime(range_start.year, range_start.month, range_start.day)
+        end = start + timedelta(days=days)
         return start, end
 
     @staticmethod
@@ -652,12 +665,15 @@ class ScheduleLoadWorker(QThread):
                     db_manager,
                 )
 
+            # SQLiteManager 已用 sqlite3.Row 轉成 dict，這裡直接沿用，不再重複複製
             payload = {
-                "schedules": [dict(row) for row in schedules],
-                "schedule_exceptions": [dict(row) for row in schedule_exceptions],
-                "holiday_entries": [dict(row) for row in holiday_entries],
+                "schedules": schedules,
+                "schedule_exceptions": schedule_exceptions,
+                "holiday_entries": holiday_entries,
                 "occurrences": occurrences,
-                "schedule_list_rows": self._build_schedule_list_rows([dict(row) for row in schedules]) if self.view_mode == "list" else [],
+                # 月檢視在背景執行緒先依日期分組，主執行緒直接套用
+                "occurrences_by_date": group_occurrences_by_date(occurrences) if self.view_mode == "month" else {},
+                "schedule_list_rows": self._build_schedule_list_rows(schedules) if self.view_mode == "list" else [],
                 "cache_key": f"{self.view_mode}|{self.reference_date_iso}",
             }
             self.loaded.emit(self.request_id, payload)
@@ -674,6 +690,8 @@ class CalendarUA(QMainWindow):
         self.db_manager: Optional[SQLiteManager] = None
         self.scheduler_worker: Optional[SchedulerWorker] = None
         self.schedules: List[Dict[str, Any]] = []
+        # schedule_id -> 排程，於每次載入排程後重建
+        self._schedule_by_id: Dict[int, Dict[str, Any]] = {}
         self.schedule_exceptions: List[Dict[str, Any]] = []
         self.holiday_entries: List[Dict[str, Any]] = []
         # 主行事曆視圖狀態
@@ -683,11 +701,27 @@ class CalendarUA(QMainWindow):
         # 執行計數器：schedule_id -> 已執行次數
         self.execution_counts: Dict[int, int] = {}
         self._cached_occurrences: List[Any] = []
+        # 月檢視用：背景執行緒已依日期分好組的 occurrence（其他檢視為空 dict）
+        self._cached_occurrences_by_date: Dict[Any, List[Any]] = {}
         self._cached_occurrences_key: str = ""
+        # 已算好的 (occurrence, 依日期分組)（key 同 _cached_occurrences_key），切換日期/視圖時直接重用；
+        # 資料異動時以 generation 遞增作廢，避免舊的背景結果寫回快取
+        self._occurrence_cache: Dict[str, tuple[List[Any], Dict[Any, List[Any]]]] = {}
+        self._occurrence_cache_generation = 0
+        # Julian day -> 是否為假日；導覽月曆與月檢視每次重繪都會逐格查詢，
+        # 假日規則只會在假日設定對話框或切換資料庫時改變，屆時清空
+        self._holiday_date_cache: Dict[int, bool] = {}
         self._schedule_list_rows: List[Dict[str, Any]] = []
         self._schedule_load_worker: Optional[ScheduleLoadWorker] = None
         self._schedule_load_in_progress = False
         self._pending_schedule_load: Optional[dict] = None
+        # 視窗隱藏（縮到系統匣）期間延後的重新載入，顯示時再補做一次
+        self._schedule_load_deferred = False
+        self._deferred_reset_execution_counts = False
+        self._main_calendar_refresh_pending = False
+        # 目前顯示在視圖上的 occurrence 與其 cache key
+        self._applied_occurrences: List[Any] = []
+        self._applied_occurrences_key = ""
         self._schedule_load_request_id = 0
         
         # 正在執行的任務ID集合，防止重複執行
@@ -696,6 +730,8 @@ class CalendarUA(QMainWindow):
         # 目前選取的排程 ID (Ribbon Edit/Delete 使用)
         self.selected_schedule_id: Optional[int] = None
         self._copied_schedule_ids: List[int] = []
+        # 資料庫設定對話框只建立一次，之後重複顯示
+        self._db_settings_dialog: Optional[DatabaseSettingsDialog] = None
 
         # 主題模式: "light", "dark", "system"
         self.current_theme = "system"
@@ -983,6 +1019,8 @@ class CalendarUA(QMainWindow):
         self.schedule_list_view.setRootIsDecorated(True)
         self.schedule_list_view.setAlternatingRowColors(True)
         self.schedule_list_view.setUniformRowHeights(False)
+        # 固定欄寬（標頭預設可手動拖曳），避免每次重建清單都量測所有文字
+        self.schedule_list_view.setColumnWidth(0, 220)
         self.calendar_stack.addWidget(self.day_view)
         self.calendar_stack.addWidget(self.week_view)
         self.calendar_stack.addWidget(self.month_view)
@@ -1192,6 +1230,9 @@ class CalendarUA(QMainWindow):
         elif self.current_theme == "system":
             is_dark = self.is_system_dark_mode()
 
+        # 讓子對話框直接讀取目前主題，不必逐層走訪父視窗
+        QApplication.instance().setProperty("calendarua_is_dark", is_dark)
+
         if is_dark:
             self._apply_dark_theme()
         else:
@@ -1815,7 +1856,7 @@ class CalendarUA(QMainWindow):
         self.combo_nav_month.blockSignals(True)
         self.combo_nav_year.blockSignals(True)
         self.combo_nav_month.setCurrentIndex(today.month() - 1)
-        year_index = self.combo_nav_year.findData(today.year())
+        year_index = self._nav_year_index(today.year())
         self.combo_nav_year.setCurrentIndex(year_index)
         self.combo_nav_month.blockSignals(False)
         self.combo_nav_year.blockSignals(False)
@@ -1838,19 +1879,27 @@ class CalendarUA(QMainWindow):
         for y in years:
             self.combo_nav_year.addItem(str(y), y)
 
-        target_index = self.combo_nav_year.findData(target_year)
+        target_index = self._nav_year_index(target_year)
         if target_index >= 0:
             self.combo_nav_year.setCurrentIndex(target_index)
         self.combo_nav_year.blockSignals(False)
 
+    def _nav_year_index(self, year: int) -> int:
+        """年份選項固定為連續年份，由第一項直接推算索引，不逐項 findData 比對。"""
+        count = self.combo_nav_year.count()
+        if count == 0:
+            return -1
+        index = year - int(self.combo_nav_year.itemData(0))
+        return index if 0 <= index < count else -1
+
     def _ensure_nav_year_available(self, year: int) -> int:
         """確保年份下拉內含指定年份。"""
-        index = self.combo_nav_year.findData(year)
+        index = self._nav_year_index(year)
         if index >= 0:
             return index
 
         self._set_nav_year_window(year, year)
-        return self.combo_nav_year.findData(year)
+        return self._nav_year_index(year)
 
     def _on_nav_year_wheel_step(self, steps: int):
         """滑鼠滾輪平移年份選項視窗，不直接切換行事曆。"""
@@ -2071,7 +2120,17 @@ class CalendarUA(QMainWindow):
         self._refresh_main_calendar_views()
 
     def _refresh_main_calendar_views(self):
-        """依目前 view mode 與日期，更新 Day/Week/Month 行事曆內容"""
+        """依目前 view mode 與日期，更新 Day/Week/Month 行事曆內容
+
+        連續點擊上一段/下一段等操作會在同一輪事件迴圈內合併為一次更新。
+        """
+        if self._main_calendar_refresh_pending:
+            return
+        self._main_calendar_refresh_pending = True
+        QTimer.singleShot(0, self._do_refresh_main_calendar_views)
+
+    def _do_refresh_main_calendar_views(self):
+        self._main_calendar_refresh_pending = False
         if not self.db_manager:
             return
 
@@ -2080,13 +2139,17 @@ class CalendarUA(QMainWindow):
 
         if self.current_view_mode == "list":
             if self._cached_occurrences_key != snapshot["cache_key"] or not self._schedule_list_rows:
-                self.load_schedules()
+                self._request_schedule_load()
             self._refresh_schedule_list_view()
             return
 
         if self._cached_occurrences_key != snapshot["cache_key"]:
-            self.load_schedules()
-            return
+            cached = self._occurrence_cache.get(snapshot["cache_key"])
+            if cached is None:
+                self._request_schedule_load()
+                return
+            self._cached_occurrences, self._cached_occurrences_by_date = cached
+            self._cached_occurrences_key = snapshot["cache_key"]
 
         self._apply_occurrences_to_views(self._cached_occurrences)
 
@@ -2114,20 +2177,33 @@ class CalendarUA(QMainWindow):
         }
 
     def _apply_occurrences_to_views(self, occurrences: List[Any]):
-        self.day_view.set_reference_date(self.reference_date)
-        self.day_view.set_occurrences(occurrences)
-        self.day_view.relayout_to_viewport()
+        self._applied_occurrences = occurrences
+        self._applied_occurrences_key = self._cached_occurrences_key
+        # occurrence 只涵蓋目前視圖的日期範圍，且切換視圖時會重新套用，
+        # 因此只更新目前顯示中的視圖，隱藏的視圖不做重繪
+        mode = self.current_view_mode
+        if mode == "day":
+            self.day_view.set_reference_date(self.reference_date)
+            self.day_view.set_occurrences(occurrences)
+            self.day_view.relayout_to_viewport()
+            return
+
+        if mode == "week":
+            self.week_view.set_reference_date(self.reference_date)
+            self.week_view.set_occurrences(occurrences)
+            self.week_view.relayout_to_viewport()
+            return
 
-        self.week_view.set_reference_date(self.reference_date)
-        self.week_view.set_occurrences(occurrences)
-        self.week_view.relayout_to_viewport()
+        if mode != "month":
+            return
 
-        self.month_view.set_reference_date(
-            QDate(self.reference_date.year(), self.reference_date.month(), 1)
+        # 假日判斷函式已於建立時設定；月份、選取日與行程一次套用，避免連續重建月格
+        self.month_view.set_view_state(
+            QDate(self.reference_date.year(), self.reference_date.month(), 1),
+            self.reference_date,
+            occurrences,
+            self._cached_occurrences_by_date if occurrences is self._cached_occurrences else None,
         )
-        self.month_view.set_selected_date(self.reference_date)
-        self.month_view.set_holiday_checker(self._is_holiday_qdate)
-        self.month_view.set_occurrences(occurrences)
 
     def _is_holiday_qdate(self, qdate: QDate) -> bool:
         """判斷日期是否為假日（週末或假日設定）。"""
@@ -2137,11 +2213,18 @@ class CalendarUA(QMainWindow):
         if not self.db_manager:
             return False
 
+        julian_day = qdate.toJulianDay()
+        cached = self._holiday_date_cache.get(julian_day)
+        if cached is not None:
+            return cached
+
         try:
             check_date = dt_date(qdate.year(), qdate.month(), qdate.day())
-            return bool(self.db_manager.is_holiday_on_date(check_date))
+            is_holiday = bool(self.db_manager.is_holiday_on_date(check_date))
         except Exception:
             return False
+        self._holiday_date_cache[julian_day] = is_holiday
+        return is_holiday
 
     def _refresh_schedule_list_view(self):
         """更新右側排程參數清單視圖。"""
@@ -2160,21 +2243,21 @@ class CalendarUA(QMainWindow):
             empty_item.setText(1, "清單資料載入中")
             return
 
+        # 先建立所有節點，再一次加入樹狀清單，避免逐筆插入觸發版面重算
+        roots: List[QTreeWidgetItem] = []
         for row in rows:
             schedule_id = int(row.get("id", 0) or 0)
             title = str(row.get("title", "")).strip() or f"任務{schedule_id}"
-            root = QTreeWidgetItem(self.schedule_list_view)
-            root.setText(0, f"{title} (ID:{schedule_id})")
-            root.setText(1, "")
-
-            for key, value in row.get("fields", []):
-                child = QTreeWidgetItem(root)
-                child.setText(0, key)
-                child.setText(1, value)
+            root = QTreeWidgetItem([f"{title} (ID:{schedule_id})", ""])
+            root.addChildren([QTreeWidgetItem([key, value]) for key, value in row.get("fields", [])])
+            roots.append(root)
 
-            root.setExpanded(True)
-
-        self.schedule_list_view.resizeColumnToContents(0)
+        self.schedule_list_view.setUpdatesEnabled(False)
+        try:
+            self.schedule_list_view.addTopLevelItems(roots)
+            self.schedule_list_view.expandAll()
+        finally:
+            self.schedule_list_view.setUpdatesEnabled(True)
 
     def _on_calendar_context_action(self, action: str, payload: dict):
         """處理 Day/Week/Month 視圖發出的右鍵選單動作"""
@@ -2198,13 +2281,12 @@ class CalendarUA(QMainWindow):
         self._context_default_minute = minute if isinstance(minute, int) else 0
 
         if date_str:
-            try:
-                y, m, d = map(int, date_str.split("-"))
-                self.reference_date = QDate(y, m, d)
+            # 由 Qt 直接解析 ISO 日期字串，不經 Python 端拆解與轉型
+            qd = QDate.fromString(str(date_str), Qt.ISODate)
+            if qd.isValid():
+                self.reference_date = qd
                 # 同步左側導覽月曆
-                self._update_nav_calendars(y, m)
-            except Exception:
-                pass
+                self._update_nav_calendars(qd.year(), qd.month())
 
         # 月視圖新增：以目前最近且「未來」的半小時作為預設開始時間。
         if action == "new" and month_mode:
@@ -2266,8 +2348,7 @@ class CalendarUA(QMainWindow):
             QMessageBox.warning(self, "提示", "找不到可複製的行程。")
             return
 
-        existing_ids = {int(s.get("id", 0) or 0) for s in self.schedules}
-        valid_ids = [sid for sid in unique_ids if sid in existing_ids]
+        valid_ids = [sid for sid in unique_ids if sid in self._schedule_by_id]
         if not valid_ids:
             QMessageBox.warning(self, "提示", "找不到可複製的行程。")
             return
@@ -2275,7 +2356,7 @@ class CalendarUA(QMainWindow):
         self._copied_schedule_ids = valid_ids
         if len(valid_ids) == 1:
             schedule_id = valid_ids[0]
-            schedule = next((s for s in self.schedules if int(s.get("id", 0) or 0) == schedule_id), None)
+            schedule = self._schedule_by_id.get(schedule_id)
             title = str(schedule.get("task_name", "")).strip() if schedule else ""
             title = title or f"任務{schedule_id}"
             self.status_bar.showMessage(f"已複製行程：{title} (ID:{schedule_id})", 2500)
@@ -2314,13 +2395,10 @@ class CalendarUA(QMainWindow):
         if reply != QMessageBox.Yes:
             return
 
-        success_count = 0
-        for sid in unique_ids:
-            try:
-                if self.db_manager.delete_schedule(sid):
-                    success_count += 1
-            except Exception:
-                continue
+        try:
+            success_count = self.db_manager.delete_schedules(unique_ids)
+        except Exception:
+            success_count = 0
 
         if success_count > 0:
             self.load_schedules()
@@ -2360,19 +2438,17 @@ class CalendarUA(QMainWindow):
             QMessageBox.warning(self, "提示", "貼上位置無效。")
             return
 
-        try:
-            y, m, d = map(int, date_text.split("-"))
-            target_date = QDate(y, m, d)
-        except Exception:
+        target_date = QDate.fromString(date_text, Qt.ISODate)
+        if not target_date.isValid():
             QMessageBox.warning(self, "提示", "貼上日期格式錯誤。")
             return
 
         target_hour = payload.get("hour")
         target_minute = payload.get("minute")
 
-        created_count = 0
+        pasted_schedules: List[Dict[str, Any]] = []
         for copied_id in copied_ids:
-            source = next((s for s in self.schedules if int(s.get("id", 0) or 0) == copied_id), None)
+            source = self._schedule_by_id.get(copied_id)
             if source is None:
                 continue
 
@@ -2393,27 +2469,28 @@ class CalendarUA(QMainWindow):
             source_title = str(source.get("task_name", "")).strip() or f"任務{copied_id}"
             pasted_title = f"{source_title}_複製"
 
-            new_id = self.db_manager.add_schedule(
-                task_name=pasted_title,
-                opc_url=str(source.get("opc_url", "") or ""),
-                node_id=str(source.get("node_id", "") or ""),
-                target_value=str(source.get("target_value", "") or ""),
-                data_type=str(source.get("data_type", "auto") or "auto"),
-                rrule_str=pasted_rrule,
-                category_id=int(source.get("category_id", 1) or 1),
-                opc_security_policy=str(source.get("opc_security_policy", "None") or "None"),
-                opc_security_mode=str(source.get("opc_security_mode", "None") or "None"),
-                opc_username=str(source.get("opc_username", "") or ""),
-                opc_password=str(source.get("opc_password", "") or ""),
-                opc_timeout=int(source.get("opc_timeout", 5) or 5),
-                opc_write_timeout=int(source.get("opc_write_timeout", 3) or 3),
-                lock_enabled=int(source.get("lock_enabled", 0) or 0),
-                is_enabled=int(source.get("is_enabled", 1) or 1),
-                ignore_holiday=int(source.get("ignore_holiday", 0) or 0),
+            pasted_schedules.append(
+                {
+                    "task_name": pasted_title,
+                    "opc_url": str(source.get("opc_url", "") or ""),
+                    "node_id": str(source.get("node_id", "") or ""),
+                    "target_value": str(source.get("target_value", "") or ""),
+                    "data_type": str(source.get("data_type", "auto") or "auto"),
+                    "rrule_str": pasted_rrule,
+                    "opc_security_policy": str(source.get("opc_security_policy", "None") or "None"),
+                    "opc_security_mode": str(source.get("opc_security_mode", "None") or "None"),
+                    "opc_username": str(source.get("opc_username", "") or ""),
+                    "opc_password": str(source.get("opc_password", "") or ""),
+                    "opc_timeout": int(source.get("opc_timeout", 5) or 5),
+                    "opc_write_timeout": int(source.get("opc_write_timeout", 3) or 3),
+                    "lock_enabled": int(source.get("lock_enabled", 0) or 0),
+                    "is_enabled": int(source.get("is_enabled", 1) or 1),
+                    "ignore_holiday": int(source.get("ignore_holiday", 0) or 0),
+                }
             )
-            if new_id:
-                created_count += 1
 
+        # 多筆貼上以單一交易批次寫入
+        created_count = self.db_manager.add_schedules_bulk(pasted_schedules)
         if created_count <= 0:
             QMessageBox.critical(self, "錯誤", "貼上行程失敗")
             return
@@ -2521,7 +2598,7 @@ class CalendarUA(QMainWindow):
         if not isinstance(schedule_id, int):
             return
 
-        target_schedule = next((s for s in self.schedules if int(s.get("id", 0) or 0) == schedule_id), None)
+        target_schedule = self._schedule_by_id.get(schedule_id)
         if target_schedule is None or not self.db_manager:
             return
 
@@ -2537,8 +2614,8 @@ class CalendarUA(QMainWindow):
             start_text = str(payload.get("start_datetime", "")).strip()
             end_text = str(payload.get("end_datetime", "")).strip()
             try:
-                new_start = datetime.strptime(start_text, "%Y-%m-%d %H:%M:%S")
-                new_end = datetime.strptime(end_text, "%Y-%m-%d %H:%M:%S")
+                new_start = datetime.fromisoformat(start_text)
+                new_end = datetime.fromisoformat(end_text)
             except ValueError:
                 return
         else:
@@ -2549,7 +2626,7 @@ class CalendarUA(QMainWindow):
                 return
 
             try:
-                base_date = datetime.strptime(date_text, "%Y-%m-%d")
+                base_date = datetime.fromisoformat(date_text)
             except ValueError:
                 return
 
@@ -2587,6 +2664,7 @@ class CalendarUA(QMainWindow):
         try:
             # 初始化 SQLite 管理器（使用預設資料庫路徑）
             self.db_manager = SQLiteManager()
+            self._holiday_date_cache.clear()
 
             # 建立資料表
             if self.db_manager.init_db():
@@ -2613,11 +2691,26 @@ class CalendarUA(QMainWindow):
 
     def load_schedules(self, reset_execution_counts: bool = False):
         """非阻塞載入排程資料，並在背景執行緒計算目前視圖需要的 occurrence。"""
+        self._invalidate_occurrence_cache()
+        if not self.isVisible():
+            # 畫面看不到時不必重建視圖，多次異動合併成顯示時的一次載入
+            self._schedule_load_deferred = True
+            self._deferred_reset_execution_counts |= bool(reset_execution_counts)
+            return
+        self._request_schedule_load(reset_execution_counts)
+
+    def _invalidate_occurrence_cache(self):
+        self._occurrence_cache.clear()
+        self._occurrence_cache_generation += 1
+
+    def _request_schedule_load(self, reset_execution_counts: bool = False):
+        """載入目前視圖資料，但保留 occurrence 快取（僅切換日期/視圖時使用）。"""
         if not self.db_manager:
             return
 
         snapshot = self._build_schedule_load_snapshot()
         snapshot["reset_execution_counts"] = bool(reset_execution_counts)
+        snapshot["cache_generation"] = self._occurrence_cache_generation
 
         if self._schedule_load_in_progress:
             self._pending_schedule_load = snapshot
@@ -2659,33 +2752,51 @@ class CalendarUA(QMainWindow):
         self._schedule_load_worker = None
 
         self.schedules = payload.get("schedules", [])
+        self._schedule_by_id = {
+            int(schedule.get("id", 0) or 0): schedule for schedule in self.schedules
+        }
         self.schedule_exceptions = payload.get("schedule_exceptions", [])
         self.holiday_entries = payload.get("holiday_entries", [])
         self._cached_occurrences = payload.get("occurrences", [])
+        self._cached_occurrences_by_date = payload.get("occurrences_by_date", {})
         self._cached_occurrences_key = str(payload.get("cache_key", ""))
+        previous_list_rows = self._schedule_list_rows
         self._schedule_list_rows = payload.get("schedule_list_rows", [])
 
+        if (
+            snapshot.get("view_mode") != "list"
+            and snapshot.get("cache_generation") == self._occurrence_cache_generation
+        ):
+            if len(self._occurrence_cache) >= _OCCURRENCE_CACHE_LIMIT:
+                # dict 保留插入順序，淘汰最早放入的項目
+                self._occurrence_cache.pop(next(iter(self._occurrence_cache)))
+            self._occurrence_cache[self._cached_occurrences_key] = (
+                self._cached_occurrences,
+                self._cached_occurrences_by_date,
+            )
+
         if snapshot.get("reset_execution_counts"):
             self.execution_counts = {}
         else:
-            active_ids = {
-                int(schedule.get("id", 0) or 0)
-                for schedule in self.schedules
-                if int(schedule.get("id", 0) or 0) > 0
-            }
             self.execution_counts = {
                 schedule_id: count
                 for schedule_id, count in self.execution_counts.items()
-                if schedule_id in active_ids
+                if schedule_id > 0 and schedule_id in self._schedule_by_id
             }
 
         latest_snapshot = self._build_schedule_load_snapshot()
         self.label_current_range.setText(latest_snapshot["range_label"])
 
+        # 重新載入的內容與畫面上相同時（例如只是重讀資料、無實際異動）不重建視圖
         if self.current_view_mode == "list":
-            self._refresh_schedule_list_view()
+            if self._schedule_list_rows != previous_list_rows:
+                self._refresh_schedule_list_view()
         elif self._cached_occurrences_key == latest_snapshot["cache_key"]:
-            self._apply_occurrences_to_views(self._cached_occurrences)
+            if (
+                self._applied_occurrences_key != self._cached_occurrences_key
+                or self._applied_occurrences != self._cached_occurrences
+            ):
+                self._apply_occurrences_to_views(self._cached_occurrences)
 
         self.status_bar.showMessage(f"已載入 {len(self.schedules)} 個排程", 3000)
 
@@ -3105,7 +3216,7 @@ class CalendarUA(QMainWindow):
             QMessageBox.information(self, "提示", "請先選擇要編輯的排程")
             return
         
-        schedule = next((s for s in self.schedules if s['id'] == schedule_id), None)
+        schedule = self._schedule_by_id.get(schedule_id)
         if not schedule:
             return
 
@@ -3120,25 +3231,29 @@ class CalendarUA(QMainWindow):
             data = dialog.get_data()
 
             if self.db_manager:
-                success = self.db_manager.update_schedule(
-                    schedule_id=schedule["id"],
-                    task_name=data["task_name"],
-                    opc_url=data["opc_url"],
-                    node_id=data["node_id"],
-                    target_value=data["target_value"],
-                    data_type=data.get("data_type", "auto"),
-                    rrule_str=data["rrule_str"],
-                    category_id=data.get("category_id", 1),
-                    opc_security_policy=data.get("opc_security_policy", "None"),
-                    opc_security_mode=data.get("opc_security_mode", "None"),
-                    opc_username=data.get("opc_username", ""),
-                    opc_password=data.get("opc_password", ""),
-                    opc_timeout=data.get("opc_timeout", 5),
-                    opc_write_timeout=data.get("opc_write_timeout", 3),
-                    lock_enabled=data.get("lock_enabled", 0),
-                    is_enabled=data.get("is_enabled", 1),
-                    ignore_holiday=data.get("ignore_holiday", 0),
-                )
+                updates = {
+                    "task_name": data["task_name"],
+                    "opc_url": data["opc_url"],
+                    "node_id": data["node_id"],
+                    "target_value": data["target_value"],
+                    "data_type": data.get("data_type", "auto"),
+                    "rrule_str": data["rrule_str"],
+                    "opc_security_policy": data.get("opc_security_policy", "None"),
+                    "opc_security_mode": data.get("opc_security_mode", "None"),
+                    "opc_username": data.get("opc_username", ""),
+                    "opc_password": data.get("opc_password", ""),
+                    "opc_timeout": data.get("opc_timeout", 5),
+                    "opc_write_timeout": data.get("opc_write_timeout", 3),
+                    "lock_enabled": data.get("lock_enabled", 0),
+                    "is_enabled": data.get("is_enabled", 1),
+                    "ignore_holiday": data.get("ignore_holiday", 0),
+                }
+                # 按下確定但內容與目前資料相同時，不寫入資料庫也不重新載入 / 重啟排程執行緒
+                if all(schedule.get(key) == value for key, value in updates.items()):
+                    self.status_bar.showMessage("排程內容未變更", 3000)
+                    return
+
+                success = self.db_manager.update_schedule(schedule_id=schedule["id"], **updates)
 
                 if success:
                     QMessageBox.information(self, "成功", "排程已更新")
@@ -3153,7 +3268,7 @@ class CalendarUA(QMainWindow):
             QMessageBox.information(self, "提示", "請先選擇要刪除的排程")
             return
         
-        schedule = next((s for s in self.schedules if s['id'] == schedule_id), None)
+        schedule = self._schedule_by_id.get(schedule_id)
         if not schedule:
             return
 
@@ -3265,9 +3380,10 @@ class CalendarUA(QMainWindow):
         if not self.db_manager:
             self.init_database()
 
-        dialog = DatabaseSettingsDialog(self, self.db_manager)
-        dialog.database_changed.connect(self.on_database_path_changed)
-        dialog.exec()
+        if self._db_settings_dialog is None:
+            self._db_settings_dialog = DatabaseSettingsDialog(self, self.db_manager)
+            self._db_settings_dialog.database_changed.connect(self.on_database_path_changed)
+        self._db_settings_dialog.reopen(self.db_manager)
 
     def show_holiday_settings(self):
         """顯示假日設定對話框。"""
@@ -3276,11 +3392,22 @@ class CalendarUA(QMainWindow):
             return
 
         dialog = HolidaySettingsDialog(self.db_manager, self)
-        if dialog.exec() == QDialog.Accepted:
-            self.holiday_entries = self.db_manager.get_all_holiday_entries()
-            self._refresh_main_calendar_views()
-            self._restart_scheduler_worker()
-            self.status_bar.showMessage("假日設定已更新", 3000)
+        accepted = dialog.exec() == QDialog.Accepted
+        # 對話框內的修改會立即寫入資料庫，不論如何關閉都要作廢假日快取
+        self._holiday_date_cache.clear()
+        if accepted:
+            # 延到下一輪事件迴圈再更新，讓對話框先關閉並重繪主視窗
+            QTimer.singleShot(0, self._on_holiday_settings_updated)
+
+    def _on_holiday_settings_updated(self):
+        """假日設定對話框關閉後，更新假日資料、行事曆與排程執行緒。"""
+        if not self.db_manager:
+            return
+        self.holiday_entries = self.db_manager.get_all_holiday_entries()
+        self._invalidate_occurrence_cache()
+        self._refresh_main_calendar_views()
+        self._restart_scheduler_worker()
+        self.status_bar.showMessage("假日設定已更新", 3000)
 
     def new_project(self):
         """建立新的專案資料庫（.db）。"""
@@ -3715,6 +3842,7 @@ class CalendarUA(QMainWindow):
         # 重新初始化資料庫管理器
         self.db_manager = SQLiteManager(new_path)
         self.db_manager.init_db()
+        self._holiday_date_cache.clear()
 
         self._load_time_scale_from_db()
 
@@ -3730,6 +3858,14 @@ class CalendarUA(QMainWindow):
         self.scheduler_worker.trigger_task.connect(self.on_task_triggered)
         self.scheduler_worker.start()
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._schedule_load_deferred:
+            reset_execution_counts = self._deferred_reset_execution_counts
+            self._schedule_load_deferred = False
+            self._deferred_reset_execution_counts = False
+            self._request_schedule_load(reset_execution_counts)
+
     def closeEvent(self, event):
         """處理視窗關閉事件"""
         import asyncio
@@ -4705,6 +4841,19 @@ class OPCSettingsDialog(QDialog):
         
         self.setup_ui()
         attach_combo_wheel_behavior(self)
+
+        # 設定值 -> 單選按鈕對照（依畫面順序），載入、讀取與過濾顯示共用同一份
+        self._policy_buttons: Dict[str, QRadioButton] = {
+            "None": self.policy_rb_none,
+            "Basic128Rsa15": self.policy_rb_basic128,
+            "Basic256": self.policy_rb_basic256,
+            "Basic256Sha256": self.policy_rb_basic256sha,
+        }
+        self._mode_buttons: Dict[str, QRadioButton] = {
+            "None": self.rb_mode_none,
+            "Sign": self.rb_mode_sign,
+            "SignAndEncrypt": self.rb_mode_sign_encrypt,
+        }
         
         # 連接信號
         self.chk_show_supported.toggled.connect(self.on_chk_show_supported_toggled)
@@ -5110,20 +5259,19 @@ class OPCSettingsDialog(QDialog):
     def load_data(self):
         """載入現有的 OPC 連線設定"""
         # 設定安全策略單選按鈕（默認為 None）
-        policy_mapping = {
-            "None": self.policy_rb_none,
-            "Basic128Rsa15": self.policy_rb_basic128,
-            "Basic256": self.policy_rb_basic256,
-            "Basic256Sha256": self.policy_rb_basic256sha,
-        }
-        policy_btn = policy_mapping.get(self.security_policy, self.policy_rb_none)
-        policy_btn.setChecked(True)
+        self._policy_buttons.get(self.security_policy, self.policy_rb_none).setChecked(True)
 
         # 設定使用者認證相關欄位（默認為 Anonymous）
+        # 切換單選按鈕會讓兩顆按鈕各觸發一次 toggled；載入期間先擋訊號，最後統一呼叫一次 on_auth_mode_changed
+        auth_buttons = (self.rb_anonymous, self.rb_username, self.rb_certificate)
+        for button in auth_buttons:
+            button.blockSignals(True)
         if self.username or self.password:
             self.rb_username.setChecked(True)
         else:
             self.rb_anonymous.setChecked(True)
+        for button in auth_buttons:
+            button.blockSignals(False)
 
         self.username_edit.setText(self.username)
         self.password_edit.setText(self.password)
@@ -5131,13 +5279,7 @@ class OPCSettingsDialog(QDialog):
         self.write_timeout_spin.setValue(self.write_timeout)
 
         # 初始化安全模式
-        mode_mapping = {
-            "None": self.rb_mode_none,
-            "Sign": self.rb_mode_sign,
-            "SignAndEncrypt": self.rb_mode_sign_encrypt,
-        }
-        mode_btn = mode_mapping.get(self.security_mode, self.rb_mode_none)
-        mode_btn.setChecked(True)
+        self._mode_buttons.get(self.security_mode, self.rb_mode_none).setChecked(True)
         
         # 初始化認證欄位可見性
         self.on_auth_mode_changed()
@@ -5147,23 +5289,15 @@ class OPCSettingsDialog(QDialog):
 
     def get_settings(self) -> Dict[str, Any]:
         """取得設定值"""
-        # security policy
-        if self.policy_rb_none.isChecked():
-            policy = "None"
-        elif self.policy_rb_basic128.isChecked():
-            policy = "Basic128Rsa15"
-        elif self.policy_rb_basic256.isChecked():
-            policy = "Basic256"
-        else:
-            policy = "Basic256Sha256"
-
-        # security mode
-        if self.rb_mode_none.isChecked():
-            mode = "None"
-        elif self.rb_mode_sign.isChecked():
-            mode = "Sign"
-        else:
-            mode = "SignAndEncrypt"
+        # security policy / mode：都沒勾選時沿用原本的預設（最後一項）
+        policy = next(
+            (name for name, btn in self._policy_buttons.items() if btn.isChecked()),
+            "Basic256Sha256",
+        )
+        mode = next(
+            (name for name, btn in self._mode_buttons.items() if btn.isChecked()),
+            "SignAndEncrypt",
+        )
 
         # auth method
         if self.rb_anonymous.isChecked():
@@ -5355,33 +5489,17 @@ class OPCSettingsDialog(QDialog):
             return
 
         # 控制安全策略單選按鈕的可見性
-        policy_buttons = [
-            (self.policy_rb_none, "None"),
-            (self.policy_rb_basic128, "Basic128Rsa15"),
-            (self.policy_rb_basic256, "Basic256"),
-            (self.policy_rb_basic256sha, "Basic256Sha256"),
-        ]
-        for btn, policy_name in policy_buttons:
+        for policy_name, btn in self._policy_buttons.items():
             btn.setVisible(policy_name in policies)
 
         # 控制安全模式單選按鈕的可見性
-        mode_buttons = [
-            (self.rb_mode_none, "None"),
-            (self.rb_mode_sign, "Sign"),
-            (self.rb_mode_sign_encrypt, "SignAndEncrypt"),
-        ]
-        for btn, mode_name in mode_buttons:
+        for mode_name, btn in self._mode_buttons.items():
             btn.setVisible(mode_name in modes)
 
     def _show_all_policies_and_modes(self):
         """顯示所有安全策略和模式（沒有過濾）"""
-        # 顯示所有安全策略
-        for btn in [self.policy_rb_none, self.policy_rb_basic128, 
-                    self.policy_rb_basic256, self.policy_rb_basic256sha]:
-            btn.setVisible(True)
-        
-        # 顯示所有安全模式
-        for btn in [self.rb_mode_none, self.rb_mode_sign, self.rb_mode_sign_encrypt]:
+        # 顯示所有安全策略與安全模式
+        for btn in (*self._policy_buttons.values(), *self._mode_buttons.values()):
             btn.setVisible(True)
 
     def _normalize_policy_name(self, fragment: str) -> str:
@@ -89,6 +89,12 @@ def to_lunar(gregorian: date) -> Optional[LunarDateInfo]:
         return None
 
 
+# 農曆顯示文字對照表，模組層級建立一次，每格重繪時直接索引
+_LUNAR_MONTH_NAMES = ("元", "二", "三", "四", "五", "六", "七", "八", "九", "十", "十一", "十二")
+_LUNAR_DAY_TENS = ("初", "十", "廿", "卅")
+_LUNAR_DAY_NUMERALS = ("一", "二", "三", "四", "五", "六", "七", "八", "九", "十")
+
+
 def format_lunar_day_text(info: LunarDateInfo) -> str:
     """將農曆日轉換成 UI 顯示文字（如初一、十五、閏二月）。"""
     n = info.lunar_day
@@ -96,21 +102,8 @@ def format_lunar_day_text(info: LunarDateInfo) -> str:
         return ""
 
     if n == 1:
-        month_names = {
-            1: "元",
-            2: "二",
-            3: "三",
-            4: "四",
-            5: "五",
-            6: "六",
-            7: "七",
-            8: "八",
-            9: "九",
-            10: "十",
-            11: "十一",
-            12: "十二",
-        }
-        month_text = month_names.get(info.lunar_month, str(info.lunar_month))
+        month = info.lunar_month
+        month_text = _LUNAR_MONTH_NAMES[month - 1] if 1 <= month <= 12 else str(month)
         leap_prefix = "閏" if info.is_leap_month else ""
         return f"{leap_prefix}{month_text}月"
 
@@ -121,7 +114,5 @@ def format_lunar_day_text(info: LunarDateInfo) -> str:
     if n == 30:
         return "三十"
 
-    chinese_ten = ["初", "十", "廿", "卅"]
-    numerals = ["一", "二", "三", "四", "五", "六", "七", "八", "九", "十"]
-    return f"{chinese_ten[(n - 1) // 10]}{numerals[(n - 1) % 10]}"
+    return f"{_LUNAR_DAY_TENS[(n - 1) // 10]}{_LUNAR_DAY_NUMERALS[(n - 1) % 10]}"
 
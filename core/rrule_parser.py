@@ -9,6 +9,34 @@ logging.basicConfig(level=logging.WARNING)
 logger = logging.getLogger(__name__)
 
 
+def parse_compact_datetime(raw: str) -> Optional[tuple[datetime, bool]]:
+    """解析 YYYYMMDD / YYYYMMDDTHHMM / YYYYMMDDTHHMMSS，回傳 (時間, 是否含時刻)。
+
+    依長度直接切片轉整數，不逐一嘗試 strptime 格式並以例外判斷失敗。
+    """
+    length = len(raw)
+    if length == 8:
+        time_part = ""
+    elif length in (13, 15) and raw[8] == "T":
+        time_part = raw[9:]
+    else:
+        return None
+    if not (raw[:8].isdigit() and (not time_part or time_part.isdigit())):
+        return None
+    try:
+        parsed = datetime(
+            int(raw[0:4]),
+            int(raw[4:6]),
+            int(raw[6:8]),
+            int(time_part[0:2] or 0),
+            int(time_part[2:4] or 0),
+            int(time_part[4:6] or 0),
+        )
+    except ValueError:
+        return None
+    return parsed, bool(time_part)
+
+
 class RRuleParser:
     """RRULE 解析器，負責解析週期性規則並計算下一次觸發時間"""
 
@@ -31,14 +59,9 @@ class RRuleParser:
     @staticmethod
     def _parse_dtstart(dtstart_raw: str, fallback: Optional[datetime] = None) -> datetime:
         if dtstart_raw:
-            for fmt in ("%Y%m%dT%H%M%S", "%Y%m%dT%H%M", "%Y%m%d"):
-                try:
-                    parsed = datetime.strptime(dtstart_raw, fmt)
-                    if fmt == "%Y%m%d":
-                        return parsed.replace(hour=0, minute=0, second=0, microsecond=0)
-                    return parsed.replace(microsecond=0)
-                except ValueError:
-                    continue
+            result = parse_compact_datetime(dtstart_raw)
+            if result is not None:
+                return result[0]
         if fallback is not None:
             return fallback.replace(microsecond=0)
         return datetime.now().replace(second=0, microsecond=0)
@@ -86,15 +109,13 @@ class RRuleParser:
         raw = (params.get("X-RANGE-START") or "").strip()
         if not raw:
             return None
-        try:
-            if "T" in raw and len(raw) >= 15:
-                return datetime.strptime(raw[:15], "%Y%m%dT%H%M%S")
-            if len(raw) >= 8:
-                d = datetime.strptime(raw[:8], "%Y%m%d")
-                return d.replace(hour=0, minute=0, second=0, microsecond=0)
-        except ValueError:
+        if "T" in raw and len(raw) >= 15:
+            result = parse_compact_datetime(raw[:15])
+        elif len(raw) >= 8:
+            result = parse_compact_datetime(raw[:8])
+        else:
             return None
-        return None
+        return result[0] if result is not None else None
 
     @staticmethod
     def _parse_until(params: dict[str, str]) -> Optional[datetime]:
@@ -102,15 +123,11 @@ class RRuleParser:
         if not until:
             return None
 
-        for fmt in ("%Y%m%dT%H%M%S", "%Y%m%dT%H%M", "%Y%m%d"):
-            try:
-                parsed = datetime.strptime(until, fmt)
-                if fmt == "%Y%m%d":
-                    return parsed.replace(hour=23, minute=59, second=59)
-                return parsed
-            except ValueError:
-                continue
-        return None
+        result = parse_compact_datetime(until)
+        if result is None:
+            return None
+        parsed, has_time = result
+        return parsed if has_time else parsed.replace(hour=23, minute=59, second=59)
 
     @staticmethod
     def _matches_lunar_rule(candidate: datetime, params: dict[str, str], dtstart: datetime) -> bool:
@@ -1,15 +1,16 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import datetime, time, timedelta
+from datetime import date, datetime, time, timedelta
 from typing import Any, Dict, List, Optional
 import re
 
-from core.rrule_parser import RRuleParser
+from core.rrule_parser import RRuleParser, parse_compact_datetime
 from core.lunar_calendar import to_lunar
 
 
-@dataclass
+# 每次切換視圖都會產生數百筆，使用 __slots__ 省去每筆的 __dict__
+@dataclass(slots=True)
 class ResolvedOccurrence:
     schedule_id: int
     source: str
@@ -23,9 +24,20 @@ class ResolvedOccurrence:
     is_holiday: bool
     occurrence_key: str
 
+    def time_range_text(self) -> str:
+        """「HH:MM - HH:MM」；固定格式直接組字串，不經 strftime。"""
+        start, end = self.start, self.end
+        return f"{start.hour:02d}:{start.minute:02d} - {end.hour:02d}:{end.minute:02d}"
+
+
+_DURATION_RE = re.compile(r"DURATION=PT(?:(\d+)H)?(?:(\d+)M)?")
+# 假日不執行 / 過期或關閉 的固定配色 (背景, 文字)
+_HOLIDAY_SKIP_COLORS = ("#c62828", "#ffffff")
+_INACTIVE_COLORS = ("#000000", "#ffffff")
+
 
 def _extract_duration_minutes(rrule_str: str) -> int:
-    match = re.search(r"DURATION=PT(?:(\d+)H)?(?:(\d+)M)?", rrule_str.upper())
+    match = _DURATION_RE.search(rrule_str.upper())
     if not match:
         return 60
 
@@ -35,32 +47,23 @@ def _extract_duration_minutes(rrule_str: str) -> int:
     return total if total > 0 else 60
 
 
-def _extract_dtstart(rrule_str: str) -> Optional[datetime]:
-    match = re.search(r"DTSTART:(\d{8}(?:T\d{6})?)", rrule_str.upper())
-    if not match:
-        return None
+_DTSTART_RE = re.compile(r"DTSTART:(\d{8}(?:T\d{6})?)")
+_RANGE_START_RE = re.compile(r"X-RANGE-START=(\d{8}(?:T\d{6})?)")
 
-    raw = match.group(1)
-    try:
-        if "T" in raw:
-            return datetime.strptime(raw, "%Y%m%dT%H%M%S")
-        return datetime.strptime(raw, "%Y%m%d")
-    except ValueError:
-        return None
 
+def _parse_compact_start(raw: str) -> Optional[datetime]:
+    result = parse_compact_datetime(raw)
+    return result[0] if result is not None else None
 
-def _extract_range_start(rrule_str: str) -> Optional[datetime]:
-    match = re.search(r"X-RANGE-START=(\d{8}(?:T\d{6})?)", rrule_str.upper())
-    if not match:
-        return None
 
-    raw = match.group(1)
-    try:
-        if "T" in raw:
-            return datetime.strptime(raw, "%Y%m%dT%H%M%S")
-        return datetime.strptime(raw, "%Y%m%d")
-    except ValueError:
-        return None
+def _extract_dtstart(rrule_str: str) -> Optional[datetime]:
+    match = _DTSTART_RE.search(rrule_str.upper())
+    return _parse_compact_start(match.group(1)) if match else None
+
+
+def _extract_range_start(rrule_str: str) -> Optional[datetime]:
+    match = _RANGE_START_RE.search(rrule_str.upper())
+    return _parse_compact_start(match.group(1)) if match else None
 
 
 def _extract_title(schedule: Dict[str, Any]) -> str:
@@ -231,7 +234,8 @@ def resolve_occurrences_for_range(
     db_manager = None,
 ) -> List[ResolvedOccurrence]:
     occurrences: List[ResolvedOccurrence] = []
-    exception_map: Dict[tuple[int, str], Dict[str, Any]] = {}
+    # (schedule_id, 日期) -> (正規化後的 action, exception)；型別轉換只在建表時做一次
+    exception_map: Dict[tuple[int, date], tuple[str, Dict[str, Any]]] = {}
 
     if schedule_exceptions:
         for exception in schedule_exceptions:
@@ -239,9 +243,14 @@ def resolve_occurrences_for_range(
                 sid = int(exception.get("schedule_id", 0) or 0)
             except (TypeError, ValueError):
                 continue
-            date_key = str(exception.get("occurrence_date", "")).strip()
-            if sid > 0 and date_key:
-                exception_map[(sid, date_key)] = exception
+            # 日期只解析一次，之後每個 trigger 直接以 date 物件查表，不必逐一轉成字串
+            try:
+                occurrence_day = date.fromisoformat(str(exception.get("occurrence_date", "")).strip())
+            except ValueError:
+                continue
+            if sid > 0:
+                action = str(exception.get("action", "")).lower()
+                exception_map[(sid, occurrence_day)] = (action, exception)
 
     holiday_entries_list = holiday_entries
     if holiday_entries_list is None and db_manager:
@@ -262,9 +271,13 @@ def resolve_occurrences_for_range(
 
         triggers = RRuleParser.get_trigger_between(rrule_str, range_start, range_end)
         configured_range_start = _extract_range_start(rrule_str)
-        duration_minutes = _extract_duration_minutes(rrule_str)
+        duration = timedelta(minutes=_extract_duration_minutes(rrule_str))
+        schedule_id = int(schedule.get("id", 0) or 0)
         title = _extract_title(schedule)
         target_value = _extract_target_value(schedule)
+        # 未被 exception 改名時，假日標題對同一排程的每個 trigger 都相同，先組好一次
+        holiday_execute_title = _append_suffix_once(title, "(假日執行)")
+        holiday_skip_title = _append_suffix_once(title, "(假日不執行)")
 
         schedule_bg, schedule_fg = _pick_color(target_value)
 
@@ -282,33 +295,32 @@ def resolve_occurrences_for_range(
                 and dtstart <= datetime.now()
             ):
                 expired_occurrence = ResolvedOccurrence(
-                    schedule_id=int(schedule.get("id", 0) or 0),
+                    schedule_id=schedule_id,
                     source="expired",
                     title=f"{title} (過期)",
                     start=dtstart,
-                    end=dtstart + timedelta(minutes=duration_minutes),
-                    category_bg="#000000",
-                    category_fg="#ffffff",
+                    end=dtstart + duration,
+                    category_bg=_INACTIVE_COLORS[0],
+                    category_fg=_INACTIVE_COLORS[1],
                     target_value=target_value,
                     is_exception=False,
                     is_holiday=False,
-                    occurrence_key=f"{int(schedule.get('id', 0) or 0)}:{dtstart.isoformat()}:expired",
+                    occurrence_key=f"{schedule_id}:{dtstart.isoformat()}:expired",
                 )
                 occurrences.append(expired_occurrence)
             continue
 
         for trigger in triggers:
             start = trigger
-            end = trigger + timedelta(minutes=duration_minutes)
+            end = trigger + duration
 
             if end <= range_start or start >= range_end:
                 continue
 
-            schedule_id = int(schedule.get("id", 0) or 0)
-            occurrence_date = start.date().isoformat()
-            exception = exception_map.get((schedule_id, occurrence_date))
+            entry = exception_map.get((schedule_id, start.date())) if exception_map else None
+            exception_action, exception = entry if entry else ("", None)
 
-            if exception and str(exception.get("action", "")).lower() == "cancel":
+            if exception_action == "cancel":
                 continue
 
             source = "weekly"
@@ -330,11 +342,11 @@ def resolve_occurrences_for_range(
                     bg_color, fg_color = schedule_bg, schedule_fg
                 else:
                     source = "holiday_skip"
-                    bg_color, fg_color = "#c62828", "#ffffff"
+                    bg_color, fg_color = _HOLIDAY_SKIP_COLORS
             else:
                 bg_color, fg_color = schedule_bg, schedule_fg
 
-            if exception and str(exception.get("action", "")).lower() == "override":
+            if exception_action == "override":
                 try:
                     override_start = exception.get("override_start")
                     override_end = exception.get("override_end")
@@ -360,25 +372,31 @@ def resolve_occurrences_for_range(
 
             if is_holiday:
                 if ignore_holiday:
-                    resolved_title = _append_suffix_once(resolved_title, "(假日執行)")
+                    if resolved_title == title:
+                        resolved_title = holiday_execute_title
+                    else:
+                        resolved_title = _append_suffix_once(resolved_title, "(假日執行)")
                     source = "holiday_execute"
                     bg_color, fg_color = schedule_bg, schedule_fg
                 else:
-                    resolved_title = _append_suffix_once(resolved_title, "(假日不執行)")
+                    if resolved_title == title:
+                        resolved_title = holiday_skip_title
+                    else:
+                        resolved_title = _append_suffix_once(resolved_title, "(假日不執行)")
                     source = "holiday_skip"
-                    bg_color, fg_color = "#c62828", "#ffffff"
+                    bg_color, fg_color = _HOLIDAY_SKIP_COLORS
 
             if configured_range_start and resolved_start < configured_range_start:
                 if not resolved_title.endswith("(過期)"):
                     resolved_title = f"{resolved_title} (過期)"
                 source = "expired"
-                bg_color, fg_color = "#000000", "#ffffff"
+                bg_color, fg_color = _INACTIVE_COLORS
 
             if is_disabled:
                 if not resolved_title.endswith("(關閉)"):
                     resolved_title = f"{resolved_title} (關閉)"
                 source = "disabled"
-                bg_color, fg_color = "#000000", "#ffffff"
+                bg_color, fg_color = _INACTIVE_COLORS
 
             if resolved_end <= resolved_start:
                 continue
@@ -400,3 +418,16 @@ def resolve_occurrences_for_range(
 
     occurrences.sort(key=lambda item: (item.start, item.end, item.schedule_id))
     return occurrences
+
+
+def group_occurrences_by_date(occurrences: List[ResolvedOccurrence]) -> Dict[date, List[ResolvedOccurrence]]:
+    """依開始日期分組；輸入需已依開始時間排序（resolve_occurrences_for_range 的輸出即是），各組沿用原順序。"""
+    grouped: Dict[date, List[ResolvedOccurrence]] = {}
+    for occurrence in occurrences:
+        day = occurrence.start.date()
+        bucket = grouped.get(day)
+        if bucket is None:
+            grouped[day] = [occurrence]
+        else:
+            bucket.append(occurrence)
+    return grouped
@@ -24,6 +24,12 @@ DEFAULT_SOLAR_HOLIDAYS = [(1, 1), (2, 28), (4, 4), (4, 5), (5, 1), (10, 10)]
 DEFAULT_LUNAR_HOLIDAYS = [(12, 31), (1, 1), (1, 2), (1, 3), (1, 4), (1, 5), (5, 5), (8, 15)]
 DEFAULT_WEEKDAY_HOLIDAYS = [6, 7]
 
+SCHEDULE_INSERT_SQL = """
+INSERT INTO schedules (task_name, opc_url, node_id, target_value, data_type, rrule_str,
+                      opc_security_policy, opc_security_mode, opc_username, opc_password, opc_timeout, opc_write_timeout, lock_enabled, is_enabled, ignore_holiday)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
 
 class SQLiteManager:
     """
@@ -41,6 +47,10 @@ class SQLiteManager:
         self.db_path = Path(db_path)
         # 確保資料庫目錄存在
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # 假日規則快取（holidays 表小且讀多寫少，寫入時失效）
+        self._holiday_cache: Optional[List[Dict[str, Any]]] = None
+        # 依星期 / 國曆月日 / 農曆月日分桶的假日規則索引，與快取一起失效
+        self._holiday_index: Optional[Dict[str, Dict[Any, tuple]]] = None
         logger.info(f"SQLite 管理器初始化完成，資料庫路徑: {self.db_path}")
 
     @contextmanager
@@ -310,6 +320,7 @@ class SQLiteManager:
                 self._ensure_default_holiday_rules(cursor)
 
                 conn.commit()
+                self._invalidate_holiday_cache()
                 logger.info("資料庫初始化成功，schedules 表格已建立")
                 
                 # 執行遷移以添加缺失的欄位
@@ -499,6 +510,7 @@ class SQLiteManager:
                 )
                 
                 conn.commit()
+                self._invalidate_holiday_cache()
                 
         except sqlite3.Error as e:
             logger.error(f"資料庫遷移失敗: {e}")
@@ -545,17 +557,11 @@ class SQLiteManager:
         Returns:
             Optional[int]: 新增排程的 ID，失敗時回傳 None
         """
-        insert_sql = """
-        INSERT INTO schedules (task_name, opc_url, node_id, target_value, data_type, rrule_str,
-                              opc_security_policy, opc_security_mode, opc_username, opc_password, opc_timeout, opc_write_timeout, lock_enabled, is_enabled, ignore_holiday)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """
-
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
-                    insert_sql,
+                    SCHEDULE_INSERT_SQL,
                     (task_name, opc_url, node_id, target_value, data_type, rrule_str,
                      opc_security_policy, opc_security_mode, opc_username, opc_password, opc_timeout, opc_write_timeout, lock_enabled, is_enabled, ignore_holiday),
                 )
@@ -568,6 +574,51 @@ class SQLiteManager:
             logger.error(f"新增排程失敗: {e}")
             return None
 
+    def add_schedules_bulk(self, schedules: List[Dict[str, Any]]) -> int:
+        """
+        批次新增排程（單一交易 + executemany）
+
+        Args:
+            schedules: 排程資料列表，欄位同 add_schedule 參數
+
+        Returns:
+            int: 成功新增的筆數，失敗時回傳 0
+        """
+        rows = [
+            (
+                schedule["task_name"],
+                schedule["opc_url"],
+                schedule["node_id"],
+                schedule["target_value"],
+                schedule.get("data_type", "auto"),
+                schedule["rrule_str"],
+                schedule.get("opc_security_policy", "None"),
+                schedule.get("opc_security_mode", "None"),
+                schedule.get("opc_username", ""),
+                schedule.get("opc_password", ""),
+                schedule.get("opc_timeout", 5),
+                schedule.get("opc_write_timeout", 3),
+                schedule.get("lock_enabled", 0),
+                schedule.get("is_enabled", 1),
+                schedule.get("ignore_holiday", 0),
+            )
+            for schedule in schedules
+        ]
+        if not rows:
+            return 0
+
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.executemany(SCHEDULE_INSERT_SQL, rows)
+                conn.commit()
+                logger.info(f"批次新增 {len(rows)} 筆排程")
+                return len(rows)
+
+        except sqlite3.Error as e:
+            logger.error(f"批次新增排程失敗: {e}")
+            return 0
+
     def get_all_schedules(self, enabled_only: bool = False) -> List[Dict[str, Any]]:
         """
         查詢所有排程資料
@@ -602,6 +653,30 @@ class SQLiteManager:
             logger.error(f"查詢排程失敗: {e}")
             return []
 
+    def count_schedules(self, enabled_only: bool = False) -> int:
+        """
+        計算排程數量（不載入排程資料列）
+
+        Args:
+            enabled_only: 是否只計算啟用的排程，預設為 False
+
+        Returns:
+            int: 排程數量，查詢失敗時回傳 0
+        """
+        count_sql = "SELECT COUNT(*) FROM schedules"
+        if enabled_only:
+            count_sql += " WHERE is_enabled = 1"
+
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(count_sql)
+                return int(cursor.fetchone()[0])
+
+        except sqlite3.Error as e:
+            logger.error(f"計算排程數量失敗: {e}")
+            return 0
+
     def delete_schedule(self, schedule_id: int) -> bool:
         """
         刪除指定排程
@@ -632,6 +707,35 @@ class SQLiteManager:
             logger.error(f"刪除排程失敗: {e}")
             return False
 
+    def delete_schedules(self, schedule_ids: List[int]) -> int:
+        """
+        批次刪除多筆排程（單一交易）
+
+        Args:
+            schedule_ids: 要刪除的排程 ID 列表
+
+        Returns:
+            int: 實際刪除的筆數，失敗回傳 0
+        """
+        ids = [int(sid) for sid in schedule_ids]
+        if not ids:
+            return 0
+
+        placeholders = ",".join("?" for _ in ids)
+        delete_sql = f"DELETE FROM schedules WHERE id IN ({placeholders})"
+
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(delete_sql, ids)
+                conn.commit()
+                logger.info(f"批次刪除排程 {cursor.rowcount} 筆")
+                return cursor.rowcount
+
+        except sqlite3.Error as e:
+            logger.error(f"批次刪除排程失敗: {e}")
+            return 0
+
     # 以下為相容性方法，與舊版 MySQLManager 介面保持一致
 
     def create_schedule(
@@ -826,6 +930,12 @@ class SQLiteManager:
 
                 deleted_count = cursor.rowcount
                 logger.info(f"已清除 {deleted_count} 筆排程資料")
+                # DELETE 不會縮小檔案，VACUUM 需在交易外執行以回收空間；
+                # 資料已刪除並提交，VACUUM 失敗（例如其他連線持有鎖）不影響清除結果
+                try:
+                    conn.execute("VACUUM")
+                except sqlite3.Error as e:
+                    logger.warning(f"清除排程後壓縮資料庫失敗: {e}")
                 return True
 
         except sqlite3.Error as e:
@@ -1002,6 +1112,7 @@ class SQLiteManager:
                     (dt.month, dt.day, name),
                 )
                 conn.commit()
+                self._invalidate_holiday_cache()
                 return cursor.lastrowid
         except (ValueError, sqlite3.Error) as e:
             logger.error(f"新增 holiday entry 失敗: {e}")
@@ -1011,9 +1122,9 @@ class SQLiteManager:
         """相容舊介面：單表模式忽略 calendar_id，回傳全部規則。"""
         return self.get_all_holiday_entries()
 
-    def get_all_holiday_entries(self) -> List[Dict[str, Any]]:
-        """查詢所有假日規則（單表）。"""
-        try:
+    def _ensure_holiday_cache(self) -> List[Dict[str, Any]]:
+        """延遲載入假日規則快取，之後的查詢直接讀記憶體。"""
+        if self._holiday_cache is None:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
@@ -1024,7 +1135,38 @@ class SQLiteManager:
                     ORDER BY CASE entry_type WHEN 'weekday' THEN 0 ELSE 1 END, calendar_type, month, day, weekday
                     """
                 )
-                return [dict(row) for row in cursor.fetchall()]
+                self._holiday_cache = [dict(row) for row in cursor.fetchall()]
+        return self._holiday_cache
+
+    def _ensure_holiday_index(self) -> Dict[str, Dict[Any, tuple]]:
+        """
+        由假日規則快取建立查詢索引，值為 (規則在快取中的順序, 規則)。
+        同一鍵只保留最先出現的規則，與逐筆掃描時「第一筆命中」的結果一致。
+        """
+        if self._holiday_index is None:
+            index: Dict[str, Dict[Any, tuple]] = {"weekday": {}, "solar": {}, "lunar": {}}
+            for position, rule in enumerate(self._ensure_holiday_cache()):
+                entry_type = rule.get("entry_type")
+                if entry_type == "weekday":
+                    weekday = int(rule.get("weekday", 0) or 0)
+                    index["weekday"].setdefault(weekday, (position, rule))
+                elif entry_type == "date":
+                    calendar_type = str(rule.get("calendar_type", "") or "").strip().lower()
+                    if calendar_type in ("solar", "lunar"):
+                        key = (int(rule.get("month", 0) or 0), int(rule.get("day", 0) or 0))
+                        index[calendar_type].setdefault(key, (position, rule))
+            self._holiday_index = index
+        return self._holiday_index
+
+    def _invalidate_holiday_cache(self) -> None:
+        """假日規則異動後清除快取。"""
+        self._holiday_cache = None
+        self._holiday_index = None
+
+    def get_all_holiday_entries(self) -> List[Dict[str, Any]]:
+        """查詢所有假日規則（單表）。"""
+        try:
+            return list(self._ensure_holiday_cache())
         except sqlite3.Error as e:
             logger.error(f"查詢所有 holiday entries 失敗: {e}")
             return []
@@ -1052,6 +1194,7 @@ class SQLiteManager:
                     (dt.month, dt.day, name, entry_id),
                 )
                 conn.commit()
+                self._invalidate_holiday_cache()
                 return cursor.rowcount > 0
         except (ValueError, sqlite3.Error) as e:
             logger.error(f"更新 holiday entry 失敗: {e}")
@@ -1064,6 +1207,7 @@ class SQLiteManager:
                 cursor = conn.cursor()
                 cursor.execute("DELETE FROM holidays WHERE id = ?", (entry_id,))
                 conn.commit()
+                self._invalidate_holiday_cache()
                 return cursor.rowcount > 0
         except sqlite3.Error as e:
             logger.error(f"刪除 holiday entry 失敗: {e}")
@@ -1085,6 +1229,7 @@ class SQLiteManager:
                         (weekday, f"週{weekday}假日"),
                     )
                 conn.commit()
+                self._invalidate_holiday_cache()
                 return True
         except sqlite3.Error as e:
             logger.error(f"設定 weekday 假日失敗: {e}")
@@ -1107,6 +1252,7 @@ class SQLiteManager:
                     (calendar_type, month, day, name),
                 )
                 conn.commit()
+                self._invalidate_holiday_cache()
                 return cursor.lastrowid
         except sqlite3.IntegrityError:
             return None
@@ -1132,6 +1278,7 @@ class SQLiteManager:
                     (calendar_type, month, day, name, rule_id),
                 )
                 conn.commit()
+                self._invalidate_holiday_cache()
                 return cursor.rowcount > 0
         except sqlite3.IntegrityError:
             return False
@@ -1172,6 +1319,7 @@ class SQLiteManager:
 
                 self._ensure_default_holiday_rules(cursor)
                 conn.commit()
+                self._invalidate_holiday_cache()
                 return True
         except sqlite3.Error as e:
             logger.error(f"覆蓋 holiday rules 失敗: {e}")
@@ -1209,25 +1357,25 @@ class SQLiteManager:
     def is_holiday_on_date(self, date_obj) -> Optional[Dict[str, Any]]:
         """判斷指定日期是否命中任一假日規則，命中時回傳規則。"""
         try:
-            rules = self.get_all_holiday_entries()
-            weekday = date_obj.isoweekday()
-            for rule in rules:
-                if rule.get("entry_type") == "weekday" and int(rule.get("weekday", 0) or 0) == weekday:
-                    return rule
-
-            for rule in rules:
-                if rule.get("entry_type") != "date":
-                    continue
-                month = int(rule.get("month", 0) or 0)
-                day = int(rule.get("day", 0) or 0)
-                calendar_type = str(rule.get("calendar_type", "") or "").strip().lower()
-                if calendar_type == "solar" and date_obj.month == month and date_obj.day == day:
-                    return rule
-                if calendar_type == "lunar":
-                    lunar_info = to_lunar(date_obj)
-                    if lunar_info and lunar_info.lunar_month == month and lunar_info.lunar_day == day:
-                        return rule
-            return None
+            index = self._ensure_holiday_index()
+            hit = index["weekday"].get(date_obj.isoweekday())
+            if hit:
+                return hit[1]
+
+            hits = []
+            solar_hit = index["solar"].get((date_obj.month, date_obj.day))
+            if solar_hit:
+                hits.append(solar_hit)
+            if index["lunar"]:
+                # 農曆換算只做一次
+                lunar_info = to_lunar(date_obj)
+                if lunar_info:
+                    lunar_hit = index["lunar"].get((lunar_info.lunar_month, lunar_info.lunar_day))
+                    if lunar_hit:
+                        hits.append(lunar_hit)
+            if not hits:
+                return None
+            return min(hits, key=lambda item: item[0])[1]
         except Exception:
             return None
 
@@ -1271,63 +1419,45 @@ class SQLiteManager:
     def save_general_settings(self, settings: Dict[str, Any]) -> bool:
         """儲存全局設定"""
         try:
+            values = (
+                settings.get("profile_name", "預設 Profile"),
+                settings.get("description", ""),
+                settings.get("enable_schedule", 1),
+                settings.get("scan_rate", 1),
+                settings.get("refresh_rate", 5),
+                settings.get("use_active_period", 0),
+                settings.get("active_from"),
+                settings.get("active_to"),
+                settings.get("output_type", "OPC UA Write"),
+                settings.get("refresh_output", 1),
+                settings.get("generate_events", 1),
+            )
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                
-                # 檢查是否已有記錄
-                cursor.execute("SELECT id FROM general_settings LIMIT 1")
-                existing = cursor.fetchone()
-                
-                if existing:
-                    # 更新現有記錄
-                    cursor.execute(
-                        """
-                        UPDATE general_settings
-                        SET profile_name = ?, description = ?, enable_schedule = ?, 
-                            scan_rate = ?, refresh_rate = ?, use_active_period = ?,
-                            active_from = ?, active_to = ?, output_type = ?,
-                            refresh_output = ?, generate_events = ?, updated_at = CURRENT_TIMESTAMP
-                        WHERE id = ?
-                        """,
-                        (
-                            settings.get("profile_name", "預設 Profile"),
-                            settings.get("description", ""),
-                            settings.get("enable_schedule", 1),
-                            settings.get("scan_rate", 1),
-                            settings.get("refresh_rate", 5),
-                            settings.get("use_active_period", 0),
-                            settings.get("active_from"),
-                            settings.get("active_to"),
-                            settings.get("output_type", "OPC UA Write"),
-                            settings.get("refresh_output", 1),
-                            settings.get("generate_events", 1),
-                            existing["id"],
-                        ),
-                    )
-                else:
-                    # 插入新記錄
+
+                # 直接更新唯一的設定列；沒有任何列被更新時才插入新記錄
+                cursor.execute(
+                    """
+                    UPDATE general_settings
+                    SET profile_name = ?, description = ?, enable_schedule = ?,
+                        scan_rate = ?, refresh_rate = ?, use_active_period = ?,
+                        active_from = ?, active_to = ?, output_type = ?,
+                        refresh_output = ?, generate_events = ?, updated_at = CURRENT_TIMESTAMP
+                    WHERE id = (SELECT id FROM general_settings LIMIT 1)
+                    """,
+                    values,
+                )
+                if cursor.rowcount == 0:
                     cursor.execute(
                         """
-                        INSERT INTO general_settings 
+                        INSERT INTO general_settings
                         (profile_name, description, enable_schedule, scan_rate, refresh_rate,
                          use_active_period, active_from, active_to, output_type, refresh_output, generate_events)
                         VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                         """,
-                        (
-                            settings.get("profile_name", "預設 Profile"),
-                            settings.get("description", ""),
-                            settings.get("enable_schedule", 1),
-                            settings.get("scan_rate", 1),
-                            settings.get("refresh_rate", 5),
-                            settings.get("use_active_period", 0),
-                            settings.get("active_from"),
-                            settings.get("active_to"),
-                            settings.get("output_type", "OPC UA Write"),
-                            settings.get("refresh_output", 1),
-                            settings.get("generate_events", 1),
-                        ),
+                        values,
                     )
-                
+
                 conn.commit()
                 return True
         except sqlite3.Error as e:
@@ -1350,37 +1480,33 @@ class SQLiteManager:
     def save_last_opc_defaults(self, defaults: Dict[str, Any]) -> bool:
         """儲存上一次使用的 OPC 設定。"""
         try:
+            values = (
+                defaults.get("opc_url", ""),
+                defaults.get("opc_security_policy", "None"),
+                defaults.get("opc_security_mode", "None"),
+                defaults.get("opc_username", ""),
+                defaults.get("opc_password", ""),
+                int(defaults.get("opc_timeout", 5) or 5),
+                int(defaults.get("opc_write_timeout", 3) or 3),
+            )
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute("SELECT id FROM general_settings LIMIT 1")
-                existing = cursor.fetchone()
-
-                if existing:
-                    cursor.execute(
-                        """
-                        UPDATE general_settings
-                        SET last_opc_url = ?,
-                            last_opc_security_policy = ?,
-                            last_opc_security_mode = ?,
-                            last_opc_username = ?,
-                            last_opc_password = ?,
-                            last_opc_timeout = ?,
-                            last_opc_write_timeout = ?,
-                            updated_at = CURRENT_TIMESTAMP
-                        WHERE id = ?
-                        """,
-                        (
-                            defaults.get("opc_url", ""),
-                            defaults.get("opc_security_policy", "None"),
-                            defaults.get("opc_security_mode", "None"),
-                            defaults.get("opc_username", ""),
-                            defaults.get("opc_password", ""),
-                            int(defaults.get("opc_timeout", 5) or 5),
-                            int(defaults.get("opc_write_timeout", 3) or 3),
-                            existing["id"],
-                        ),
-                    )
-                else:
+                cursor.execute(
+                    """
+                    UPDATE general_settings
+                    SET last_opc_url = ?,
+                        last_opc_security_policy = ?,
+                        last_opc_security_mode = ?,
+                        last_opc_username = ?,
+                        last_opc_password = ?,
+                        last_opc_timeout = ?,
+                        last_opc_write_timeout = ?,
+                        updated_at = CURRENT_TIMESTAMP
+                    WHERE id = (SELECT id FROM general_settings LIMIT 1)
+                    """,
+                    values,
+                )
+                if cursor.rowcount == 0:
                     cursor.execute(
                         """
                         INSERT INTO general_settings (
@@ -1389,20 +1515,7 @@ class SQLiteManager:
                             last_opc_username, last_opc_password, last_opc_timeout, last_opc_write_timeout
                         ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                         """,
-                        (
-                            "預設 Profile",
-                            "CalendarUA 排程系統",
-                            1,
-                            1,
-                            5,
-                            defaults.get("opc_url", ""),
-                            defaults.get("opc_security_policy", "None"),
-                            defaults.get("opc_security_mode", "None"),
-                            defaults.get("opc_username", ""),
-                            defaults.get("opc_password", ""),
-                            int(defaults.get("opc_timeout", 5) or 5),
-                            int(defaults.get("opc_write_timeout", 3) or 3),
-                        ),
+                        ("預設 Profile", "CalendarUA 排程系統", 1, 1, 5) + values,
                     )
 
                 conn.commit()
@@ -1430,20 +1543,16 @@ class SQLiteManager:
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute("SELECT id FROM general_settings LIMIT 1")
-                existing = cursor.fetchone()
-
-                if existing:
-                    cursor.execute(
-                        """
-                        UPDATE general_settings
-                        SET time_scale_minutes = ?,
-                            updated_at = CURRENT_TIMESTAMP
-                        WHERE id = ?
-                        """,
-                        (minutes, existing["id"]),
-                    )
-                else:
+                cursor.execute(
+                    """
+                    UPDATE general_settings
+                    SET time_scale_minutes = ?,
+                        updated_at = CURRENT_TIMESTAMP
+                    WHERE id = (SELECT id FROM general_settings LIMIT 1)
+                    """,
+                    (minutes,),
+                )
+                if cursor.rowcount == 0:
                     cursor.execute(
                         """
                         INSERT INTO general_settings (
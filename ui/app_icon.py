@@ -1,11 +1,14 @@
 import os
 import sys
+from typing import Optional
 
 from PySide6.QtGui import QIcon
 
+# 主視窗、系統匣與各對話框共用同一個 QIcon，只從磁碟解碼一次
+_cached_icon: Optional[QIcon] = None
 
-def get_app_icon() -> QIcon:
-    """Return application icon for both dev and PyInstaller environments."""
+
+def _load_app_icon() -> QIcon:
     if getattr(sys, "frozen", False):
         base_path = getattr(sys, "_MEIPASS", "")
         icon_name = "lioil.ico" if os.name == "nt" else "lioil.icns"
@@ -18,3 +21,11 @@ def get_app_icon() -> QIcon:
         return QIcon(icon_name)
 
     return QIcon()
+
+
+def get_app_icon() -> QIcon:
+    """Return application icon for both dev and PyInstaller environments."""
+    global _cached_icon
+    if _cached_icon is None:
+        _cached_icon = _load_app_icon()
+    return _cached_icon
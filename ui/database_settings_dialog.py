@@ -4,6 +4,7 @@
 """
 
 from PySide6.QtWidgets import (
+    QApplication,
     QDialog,
     QVBoxLayout,
     QHBoxLayout,
@@ -15,14 +16,253 @@ from PySide6.QtWidgets import (
     QMessageBox,
     QFileDialog,
     QTextEdit,
+    QProgressBar,
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QThread
 from pathlib import Path
 from datetime import datetime
+import os
+import shutil
+import sqlite3
 from database.sqlite_manager import SQLiteManager
 from ui.app_icon import get_app_icon
 
 
+# 每次 backup step 複製的頁數（預設 4 KiB 頁約 4 MiB），用於驅動進度條
+_BACKUP_PAGES_PER_STEP = 1024
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+# 資料庫資訊顯示範本
+_INFO_TMPL = (
+    "資料庫統計資訊:\n\n"
+    "總排程數量: {total}\n"
+    "啟用排程數量: {enabled}\n"
+    "停用排程數量: {disabled}\n\n"
+    "檔案資訊:\n"
+    "路徑: {path}\n"
+    "大小: {size}\n"
+    "修改時間: {mtime}\n"
+)
+
+
+# 亮色 / 暗色主題樣式表（模組層級常數，避免每次開啟對話框重建字串）
+_LIGHT_QSS = """
+    QDialog {
+        background-color: #f8f9fa;
+    }
+
+    QGroupBox {
+        font-weight: bold;
+        border: 2px solid #dee2e6;
+        border-radius: 5px;
+        margin-top: 1ex;
+        background-color: white;
+    }
+
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 10px 0 10px;
+        color: #495057;
+    }
+
+    QLabel#fieldLabel {
+        color: #495057;
+        font-weight: bold;
+    }
+
+    QLineEdit, QTextEdit {
+        border: 1px solid #ced4da;
+        border-radius: 4px;
+        padding: 6px;
+        background-color: white;
+        color: #495057;
+    }
+
+    QComboBox {
+        border: 1px solid #ced4da;
+        border-radius: 4px;
+        padding: 6px;
+        background-color: white;
+        color: #495057;
+    }
+
+    QComboBox::drop-down {
+        width: 0px;
+        border: none;
+    }
+
+    QComboBox::down-arrow {
+        image: none;
+        width: 0px;
+        height: 0px;
+    }
+
+    QLineEdit:focus, QTextEdit:focus {
+        border-color: #80bdff;
+        outline: none;
+    }
+
+    QPushButton {
+        background-color: #e9ecef;
+        color: #111111;
+        border: 1px solid #9aa4ad;
+        border-radius: 4px;
+        padding: 8px 16px;
+        font-weight: bold;
+    }
+
+    QPushButton:hover {
+        background-color: #c7d4e2;
+    }
+
+    QPushButton:pressed {
+        background-color: #cfd6dd;
+    }
+
+    QProgressBar {
+        border: 1px solid #ced4da;
+        border-radius: 4px;
+        text-align: center;
+    }
+
+    QProgressBar::chunk {
+        background-color: #007bff;
+        border-radius: 3px;
+    }
+"""
+
+_DARK_QSS = """
+    QDialog {
+        background-color: #2b2b2b;
+    }
+
+    QGroupBox {
+        font-weight: bold;
+        border: 2px solid #3d3d3d;
+        border-radius: 5px;
+        margin-top: 1ex;
+        background-color: #363636;
+    }
+
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 10px 0 10px;
+        color: #cccccc;
+    }
+
+    QLabel#fieldLabel {
+        color: #cccccc;
+        font-weight: bold;
+    }
+
+    QLineEdit, QTextEdit {
+        border: 1px solid #555555;
+        border-radius: 4px;
+        padding: 6px;
+        background-color: #1e1e1e;
+        color: #cccccc;
+    }
+
+    QComboBox {
+        border: 1px solid #555555;
+        border-radius: 4px;
+        padding: 6px;
+        background-color: #1e1e1e;
+        color: #cccccc;
+    }
+
+    QComboBox::drop-down {
+        width: 0px;
+        border: none;
+    }
+
+    QComboBox::down-arrow {
+        image: none;
+        width: 0px;
+        height: 0px;
+    }
+
+    QLineEdit:focus, QTextEdit:focus {
+        border-color: #0e639c;
+        outline: none;
+    }
+
+    QPushButton {
+        background-color: #0e639c;
+        color: white;
+        border: 1px solid #2a8ccd;
+        border-radius: 4px;
+        padding: 8px 16px;
+        font-weight: bold;
+    }
+
+    QPushButton:hover {
+        background-color: #1f89cd;
+    }
+
+    QPushButton:pressed {
+        background-color: #094771;
+    }
+
+    QProgressBar {
+        border: 1px solid #555555;
+        border-radius: 4px;
+        text-align: center;
+        background-color: #1e1e1e;
+    }
+
+    QProgressBar::chunk {
+        background-color: #0e639c;
+        border-radius: 3px;
+    }
+"""
+
+
+class _CopyWorker(QThread):
+    """背景複製資料庫檔案，避免大型檔案複製時凍結 GUI"""
+
+    progress = Signal(int)
+    copied = Signal(str)
+    failed = Signal(str)
+
+    def __init__(self, src, dst, parent=None):
+        super().__init__(parent)
+        self.src = src
+        self.dst = dst
+
+    def _backup_sqlite(self) -> None:
+        """使用 SQLite Online Backup API 逐頁複製，可在有其他連線時取得一致快照"""
+        src = sqlite3.connect(Path(self.src).resolve().as_uri() + "?mode=ro", uri=True)
+        try:
+            dst = sqlite3.connect(self.dst)
+            try:
+                src.backup(
+                    dst,
+                    pages=_BACKUP_PAGES_PER_STEP,
+                    progress=lambda _status, remaining, total: self.progress.emit(
+                        (total - remaining) * 100 // total if total else 100
+                    ),
+                )
+            finally:
+                dst.close()
+        finally:
+            src.close()
+
+    def run(self):
+        try:
+            try:
+                self._backup_sqlite()
+            except sqlite3.DatabaseError:
+                # 來源或目標不是 SQLite 資料庫時改用檔案層複製
+                shutil.copy2(self.src, self.dst)
+            self.progress.emit(100)
+            self.copied.emit(str(self.dst))
+        except Exception as e:
+            self.failed.emit(str(e))
+
+
 class DatabaseSettingsDialog(QDialog):
     """資料庫設定對話框"""
 
@@ -36,14 +276,21 @@ class DatabaseSettingsDialog(QDialog):
         self.setMinimumWidth(500)
         self.setMinimumHeight(560)
         self.setModal(True)
+        self._copy_worker: _CopyWorker | None = None
+        # 樣式與資料庫統計延後到第一次顯示時才載入
+        self._styled = False
+        # 目前資料庫路徑，與 path_edit 內容同步
+        self._current_path = os.fspath(db_manager.db_path) if db_manager else ""
 
         self.setup_ui()
-        self.apply_modern_style()
         self.connect_signals()
-        self.load_current_settings()
 
     def setup_ui(self):
         """設定主介面"""
+        self._save_dialog = QFileDialog(self, "選擇資料庫檔案")
+        self._save_dialog.setAcceptMode(QFileDialog.AcceptSave)
+        self._save_dialog.setNameFilter("SQLite 資料庫 (*.db);;所有檔案 (*)")
+
         main_layout = QVBoxLayout(self)
         main_layout.setSpacing(12)
         main_layout.setContentsMargins(15, 15, 15, 15)
@@ -74,12 +321,18 @@ class DatabaseSettingsDialog(QDialog):
         self.path_edit.setReadOnly(True)
         path_layout.addWidget(self.path_edit)
 
-        change_btn = QPushButton("變更...")
-        change_btn.clicked.connect(self.change_database_path)
-        path_layout.addWidget(change_btn)
+        self.change_btn = QPushButton("變更...")
+        self.change_btn.clicked.connect(self.change_database_path)
+        path_layout.addWidget(self.change_btn)
 
         layout.addLayout(path_layout)
 
+        # 複製資料庫時的進度顯示
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setVisible(False)
+        layout.addWidget(self.progress_bar)
+
         return group
 
     def create_info_group(self) -> QGroupBox:
@@ -113,238 +366,74 @@ class DatabaseSettingsDialog(QDialog):
 
     def apply_modern_style(self):
         """應用現代化樣式，支援主題切換"""
-        is_dark = self.is_dark_mode()
-
-        if is_dark:
-            self._apply_dark_theme()
-        else:
-            self._apply_light_theme()
+        self.setStyleSheet(_DARK_QSS if self.is_dark_mode() else _LIGHT_QSS)
 
     def is_dark_mode(self) -> bool:
-        """檢查是否使用暗色模式"""
-        # 遍歷父視窗鏈查找主題設定
-        parent = self.parent()
-        while parent:
-            if hasattr(parent, "current_theme"):
-                if parent.current_theme == "dark":
-                    return True
-                elif parent.current_theme == "system":
-                    if hasattr(parent, "is_system_dark_mode"):
-                        return parent.is_system_dark_mode()
-                return False
-            parent = parent.parent() if hasattr(parent, "parent") else None
-        return False
-
-    def _apply_light_theme(self):
-        """套用亮色主題"""
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #f8f9fa;
-            }
-
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #dee2e6;
-                border-radius: 5px;
-                margin-top: 1ex;
-                background-color: white;
-            }
-
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 10px 0 10px;
-                color: #495057;
-            }
-
-            QLabel#fieldLabel {
-                color: #495057;
-                font-weight: bold;
-            }
-
-            QLineEdit, QTextEdit {
-                border: 1px solid #ced4da;
-                border-radius: 4px;
-                padding: 6px;
-                background-color: white;
-                color: #495057;
-            }
-
-            QComboBox {
-                border: 1px solid #ced4da;
-                border-radius: 4px;
-                padding: 6px;
-                background-color: white;
-                color: #495057;
-            }
-
-            QComboBox::drop-down {
-                width: 0px;
-                border: none;
-            }
-
-            QComboBox::down-arrow {
-                image: none;
-                width: 0px;
-                height: 0px;
-            }
-
-            QLineEdit:focus, QTextEdit:focus {
-                border-color: #80bdff;
-                outline: none;
-            }
-
-            QPushButton {
-                background-color: #e9ecef;
-                color: #111111;
-                border: 1px solid #9aa4ad;
-                border-radius: 4px;
-                padding: 8px 16px;
-                font-weight: bold;
-            }
-
-            QPushButton:hover {
-                background-color: #c7d4e2;
-            }
-
-            QPushButton:pressed {
-                background-color: #cfd6dd;
-            }
-
-            QProgressBar {
-                border: 1px solid #ced4da;
-                border-radius: 4px;
-                text-align: center;
-            }
-
-            QProgressBar::chunk {
-                background-color: #007bff;
-                border-radius: 3px;
-            }
-        """)
-
-    def _apply_dark_theme(self):
-        """套用暗色主題"""
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #2b2b2b;
-            }
-
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #3d3d3d;
-                border-radius: 5px;
-                margin-top: 1ex;
-                background-color: #363636;
-            }
-
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 10px 0 10px;
-                color: #cccccc;
-            }
-
-            QLabel#fieldLabel {
-                color: #cccccc;
-                font-weight: bold;
-            }
-
-            QLineEdit, QTextEdit {
-                border: 1px solid #555555;
-                border-radius: 4px;
-                padding: 6px;
-                background-color: #1e1e1e;
-                color: #cccccc;
-            }
-
-            QComboBox {
-                border: 1px solid #555555;
-                border-radius: 4px;
-                padding: 6px;
-                background-color: #1e1e1e;
-                color: #cccccc;
-            }
-
-            QComboBox::drop-down {
-                width: 0px;
-                border: none;
-            }
-
-            QComboBox::down-arrow {
-                image: none;
-                width: 0px;
-                height: 0px;
-            }
-
-            QLineEdit:focus, QTextEdit:focus {
-                border-color: #0e639c;
-                outline: none;
-            }
-
-            QPushButton {
-                background-color: #0e639c;
-                color: white;
-                border: 1px solid #2a8ccd;
-                border-radius: 4px;
-                padding: 8px 16px;
-                font-weight: bold;
-            }
-
-            QPushButton:hover {
-                background-color: #1f89cd;
-            }
-
-            QPushButton:pressed {
-                background-color: #094771;
-            }
-
-            QProgressBar {
-                border: 1px solid #555555;
-                border-radius: 4px;
-                text-align: center;
-                background-color: #1e1e1e;
-            }
-
-            QProgressBar::chunk {
-                background-color: #0e639c;
-                border-radius: 3px;
-            }
-        """)
+        """檢查是否使用暗色模式（由主視窗套用主題時寫入 QApplication 屬性）"""
+        app = QApplication.instance()
+        return bool(app.property("calendarua_is_dark")) if app else False
+
+    def showEvent(self, event):
+        if not self._styled:
+            self.apply_modern_style()
+            self.load_current_settings()
+            self._styled = True
+        super().showEvent(event)
+
+    def reopen(self, db_manager: SQLiteManager = None) -> int:
+        """重新顯示已建立的對話框；主題與資料庫可能已變更，故重新套用後再開啟"""
+        if db_manager is not None:
+            self.db_manager = db_manager
+        if self._styled:
+            self.apply_modern_style()
+            self.load_current_settings()
+        return self.exec()
+
+    def done(self, result):
+        """複製進行中不允許關閉對話框，避免執行緒隨對話框被銷毀"""
+        if self._copy_worker is not None and self._copy_worker.isRunning():
+            return
+        super().done(result)
 
     def connect_signals(self):
         """連接訊號"""
-        pass
+        self.path_edit.textChanged.connect(self._on_path_text_changed)
+
+    def _on_path_text_changed(self, text: str):
+        self._current_path = text
 
     def load_current_settings(self):
         """載入當前設定"""
         if self.db_manager:
-            self.path_edit.setText(str(self.db_manager.db_path))
+            self.path_edit.setText(os.fspath(self.db_manager.db_path))
             self.refresh_database_info()
 
     def change_database_path(self):
         """變更資料庫路徑"""
-        current_path = self.path_edit.text()
+        current_path = self._current_path
         if not current_path:
             current_path = "./database/calendarua.db"
 
-        file_path, _ = QFileDialog.getSaveFileName(
-            self,
-            "選擇資料庫檔案",
-            current_path,
-            "SQLite 資料庫 (*.db);;所有檔案 (*)",
-        )
+        # 重複使用同一個檔案對話框，避免每次重新初始化原生對話框
+        self._save_dialog.selectFile(current_path)
+        file_path = ""
+        if self._save_dialog.exec():
+            file_path = self._save_dialog.selectedFiles()[0]
 
         if file_path:
             # 確認檔案副檔名
             if not file_path.endswith('.db'):
                 file_path += '.db'
 
-            # 檢查是否需要複製現有資料庫
-            old_path = Path(self.path_edit.text())
-            new_path = Path(file_path)
+            old_path = self._current_path
+            new_path = file_path
+
+            # 選到同一個檔案時不需變更，避免主視窗重新初始化資料庫與排程
+            if self._is_same_file(old_path, new_path):
+                return
 
-            if old_path.exists() and old_path != new_path:
+            # 檢查是否需要複製現有資料庫
+            if os.path.exists(old_path):
                 reply = QMessageBox.question(
                     self,
                     "複製資料庫",
@@ -355,29 +444,80 @@ class DatabaseSettingsDialog(QDialog):
                 if reply == QMessageBox.Cancel:
                     return
                 elif reply == QMessageBox.Yes:
-                    try:
-                        # 確保目標目錄存在
-                        new_path.parent.mkdir(parents=True, exist_ok=True)
-                        shutil.copy2(old_path, new_path)
-                    except Exception as e:
-                        QMessageBox.critical(
-                            self,
-                            "複製失敗",
-                            f"無法複製資料庫檔案:\n{str(e)}"
-                        )
-                        return
-
-            # 更新路徑
-            self.path_edit.setText(str(new_path))
-
-            # 發出變更訊號
-            self.database_changed.emit(str(new_path))
-
-            QMessageBox.information(
+                    self._start_copy(old_path, new_path)
+                    return
+
+            self._apply_new_path(new_path)
+
+    @staticmethod
+    def _is_same_file(old_path: str, new_path: str) -> bool:
+        """判斷兩個路徑是否指向同一檔案（含符號連結、大小寫不敏感檔案系統等不同寫法）"""
+        if old_path == new_path:
+            return True
+        try:
+            return os.path.samefile(old_path, new_path)
+        except OSError:
+            # 目標尚不存在時必定不是同一檔案
+            return False
+
+    def _start_copy(self, old_path: str, new_path: str):
+        """於背景執行緒複製資料庫，完成後再套用新路徑"""
+        try:
+            # 確保目標目錄存在
+            target_dir = os.path.dirname(new_path)
+            if target_dir:
+                os.makedirs(target_dir, exist_ok=True)
+        except Exception as e:
+            QMessageBox.critical(
                 self,
-                "路徑變更",
-                "資料庫路徑已更新。請重新啟動應用程式以使用新資料庫。"
+                "複製失敗",
+                f"無法複製資料庫檔案:\n{str(e)}"
             )
+            return
+
+        self._copy_worker = _CopyWorker(old_path, new_path, self)
+        self._copy_worker.progress.connect(self.progress_bar.setValue)
+        self._copy_worker.copied.connect(self._on_copy_finished)
+        self._copy_worker.failed.connect(self._on_copy_failed)
+        self.progress_bar.setValue(0)
+        self.progress_bar.setVisible(True)
+        self.change_btn.setEnabled(False)
+        self._copy_worker.start()
+
+    def _release_copy_worker(self):
+        """回收複製執行緒並恢復操作按鈕"""
+        if self._copy_worker is not None:
+            self._copy_worker.wait()
+            self._copy_worker.deleteLater()
+            self._copy_worker = None
+        self.progress_bar.setVisible(False)
+        self.change_btn.setEnabled(True)
+
+    def _on_copy_finished(self, new_path: str):
+        self._release_copy_worker()
+        self._apply_new_path(new_path)
+
+    def _on_copy_failed(self, message: str):
+        self._release_copy_worker()
+        QMessageBox.critical(
+            self,
+            "複製失敗",
+            f"無法複製資料庫檔案:\n{message}"
+        )
+
+    def _apply_new_path(self, new_path: str):
+        """套用新的資料庫路徑並通知主視窗"""
+        # 更新路徑
+        self.path_edit.setText(new_path)
+
+        # 發出變更訊號
+        self.database_changed.emit(new_path)
+
+        QMessageBox.information(
+            self,
+            "路徑變更",
+            "資料庫路徑已更新。請重新啟動應用程式以使用新資料庫。"
+        )
 
     def refresh_database_info(self):
         """重新整理資料庫資訊"""
@@ -387,44 +527,38 @@ class DatabaseSettingsDialog(QDialog):
 
         try:
             # 取得統計資訊
-            total_schedules = len(self.db_manager.get_all_schedules())
-            enabled_schedules = len(self.db_manager.get_all_schedules(enabled_only=True))
-
-            # 取得資料庫檔案資訊
-            db_path = Path(self.db_manager.db_path)
-            file_size = 0
-            if db_path.exists():
-                file_size = db_path.stat().st_size
-
-            # 格式化資訊
-            info = f"""資料庫統計資訊:
-
-總排程數量: {total_schedules}
-啟用排程數量: {enabled_schedules}
-停用排程數量: {total_schedules - enabled_schedules}
-
-檔案資訊:
-路徑: {db_path}
-大小: {self.format_file_size(file_size)}
-修改時間: {datetime.fromtimestamp(db_path.stat().st_mtime).strftime('%Y-%m-%d %H:%M:%S') if db_path.exists() else '檔案不存在'}
-"""
-
-            self.info_text.setPlainText(info)
+            total_schedules = self.db_manager.count_schedules()
+            enabled_schedules = self.db_manager.count_schedules(enabled_only=True)
+
+            # 取得資料庫檔案資訊（單次 stat，避免 exists/stat 之間檔案狀態不一致）
+            db_path = os.fspath(self.db_manager.db_path)
+            try:
+                st = os.stat(db_path)
+                file_size = st.st_size
+                mtime_text = datetime.fromtimestamp(st.st_mtime).strftime('%Y-%m-%d %H:%M:%S')
+            except FileNotFoundError:
+                file_size = 0
+                mtime_text = '檔案不存在'
+
+            self.info_text.setPlainText(
+                _INFO_TMPL.format(
+                    total=total_schedules,
+                    enabled=enabled_schedules,
+                    disabled=total_schedules - enabled_schedules,
+                    path=db_path,
+                    size=self.format_file_size(file_size),
+                    mtime=mtime_text,
+                )
+            )
 
         except Exception as e:
             self.info_text.setPlainText(f"取得資料庫資訊時發生錯誤:\n{str(e)}")
 
     def format_file_size(self, size_bytes: int) -> str:
         """格式化檔案大小"""
-        if size_bytes == 0:
+        if size_bytes <= 0:
             return "0 B"
 
-        size_names = ["B", "KB", "MB", "GB"]
-        i = 0
-        size = size_bytes
-
-        while size >= 1024 and i < len(size_names) - 1:
-            size /= 1024.0
-            i += 1
-
-        return f"{size:.1f} {size_names[i]}"
\ No newline at end of file
+        # bit_length 直接求得 1024 的次方數，不需迴圈除法
+        i = min((size_bytes.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+        return f"{size_bytes / (1 << (10 * i)):.1f} {_SIZE_UNITS[i]}"
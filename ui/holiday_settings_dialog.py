@@ -3,7 +3,7 @@ from __future__ import annotations
 import csv
 from typing import Any, Dict, List, Optional
 
-from PySide6.QtCore import Qt, QEvent
+from PySide6.QtCore import Qt, QEvent, QSignalBlocker
 from PySide6.QtGui import QAction
 from PySide6.QtWidgets import (
     QCheckBox,
@@ -24,6 +24,13 @@ from database.sqlite_manager import SQLiteManager
 from ui.combo_wheel_helper import attach_combo_wheel_behavior
 
 
+# 曆法代碼與顯示文字的對照（依下拉選單順序）
+_CALENDAR_TYPE_LABELS = {"solar": "國曆", "lunar": "農曆"}
+# 月、日下拉選單顯示文字，模組載入時建立一次供每次開啟編輯視窗共用
+_MONTH_ITEM_LABELS = tuple(f"{m} 月" for m in range(1, 13))
+_DAY_ITEM_LABELS = tuple(f"{d} 日" for d in range(1, 32))
+
+
 class HolidaySettingsDialog(QDialog):
     """假日設定對話框。"""
 
@@ -42,6 +49,10 @@ class HolidaySettingsDialog(QDialog):
         self.db_manager = db_manager
         self.selected_rule_id: Optional[int] = None
         self._loading_data = False
+        # 與 table_rules 列順序一致的規則資料，選取時直接依列號取用
+        self._rules: List[Dict[str, Any]] = []
+        # 新增/編輯共用同一個日期規則 popup，首次使用時才建立
+        self._rule_dialog: Optional[HolidayRuleEditDialog] = None
 
         self.setWindowTitle("假日設定")
         self.setModal(True)
@@ -114,11 +125,9 @@ class HolidaySettingsDialog(QDialog):
 
         weekdays = set(int(x) for x in payload.get("weekdays", []))
         for weekday, cb in self.weekday_checks.items():
-            cb.blockSignals(True)
-            cb.setChecked(weekday in weekdays)
-            cb.blockSignals(False)
+            with QSignalBlocker(cb):
+                cb.setChecked(weekday in weekdays)
 
-        self.table_rules.setRowCount(0)
         sorted_dates = sorted(
             payload.get("dates", []),
             key=lambda rule: (
@@ -127,25 +136,40 @@ class HolidaySettingsDialog(QDialog):
                 int(rule.get("day", 0) or 0),
             ),
         )
-        for rule in sorted_dates:
-            self._append_rule_to_table(rule)
+        rules = [
+            {
+                "id": int(rule.get("id", 0) or 0),
+                "calendar_type": "solar" if str(rule.get("calendar_type", "solar") or "solar") == "solar" else "lunar",
+                "month": int(rule.get("month", 1) or 1),
+                "day": int(rule.get("day", 1) or 1),
+            }
+            for rule in sorted_dates
+        ]
+        # 重建期間暫停重繪與選取訊號，結束後只重繪一次
+        self.table_rules.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(self.table_rules):
+                # 規則內容未變（例如編輯後未實際修改、只改週別假日）時保留現有表格
+                if rules == self._rules:
+                    self.table_rules.clearSelection()
+                else:
+                    self._rules = rules
+                    # 一次配置好列數再填值，避免逐列 insertRow 造成重複版面計算
+                    self.table_rules.clearContents()
+                    self.table_rules.setRowCount(len(self._rules))
+                    for row, rule in enumerate(self._rules):
+                        self._set_rule_row(row, rule)
+        finally:
+            self.table_rules.setUpdatesEnabled(True)
 
         self.selected_rule_id = None
         self._loading_data = False
 
-    def _append_rule_to_table(self, rule: Dict[str, Any]) -> None:
-        row = self.table_rules.rowCount()
-        self.table_rules.insertRow(row)
-
-        rule_id = int(rule.get("id", 0) or 0)
-        calendar_type = str(rule.get("calendar_type", "solar") or "solar")
-        month = int(rule.get("month", 1) or 1)
-        day = int(rule.get("day", 1) or 1)
+    def _set_rule_row(self, row: int, rule: Dict[str, Any]) -> None:
+        cal_text = _CALENDAR_TYPE_LABELS[rule["calendar_type"]]
+        date_text = f"{rule['month']}/{rule['day']}"
 
-        cal_text = "國曆" if calendar_type == "solar" else "農曆"
-        date_text = f"{month}/{day}"
-
-        self.table_rules.setItem(row, 0, QTableWidgetItem(str(rule_id)))
+        self.table_rules.setItem(row, 0, QTableWidgetItem(str(rule["id"])))
         self.table_rules.setItem(row, 1, QTableWidgetItem(cal_text))
         self.table_rules.setItem(row, 2, QTableWidgetItem(date_text))
 
@@ -156,10 +180,23 @@ class HolidaySettingsDialog(QDialog):
         ok = self.db_manager.set_weekday_holidays(weekdays)
         if not ok:
             QMessageBox.warning(self, "失敗", "儲存週別假日失敗。")
-        self._load_data()
+            # 失敗時才重新載入，讓勾選狀態回到資料庫內容；成功時畫面已與資料庫一致
+            self._load_data()
+
+    def _get_rule_dialog(
+        self,
+        calendar_type: str = "solar",
+        month: int = 1,
+        day: int = 1,
+    ) -> "HolidayRuleEditDialog":
+        if self._rule_dialog is None:
+            self._rule_dialog = HolidayRuleEditDialog(self, calendar_type=calendar_type, month=month, day=day)
+        else:
+            self._rule_dialog.reset(calendar_type, month, day)
+        return self._rule_dialog
 
     def _add_rule_from_popup(self) -> None:
-        dialog = HolidayRuleEditDialog(self)
+        dialog = self._get_rule_dialog()
         if dialog.exec() != QDialog.Accepted:
             return
 
@@ -184,8 +221,7 @@ class HolidaySettingsDialog(QDialog):
             QMessageBox.information(self, "提示", "請先選擇要編輯的日期。")
             return
 
-        dialog = HolidayRuleEditDialog(
-            self,
+        dialog = self._get_rule_dialog(
             calendar_type=selected["calendar_type"],
             month=selected["month"],
             day=selected["day"],
@@ -215,7 +251,20 @@ class HolidaySettingsDialog(QDialog):
             QMessageBox.warning(self, "失敗", "刪除失敗。")
             return
 
-        self._load_data()
+        # 只移除該列，不重新查詢整份假日資料
+        row = next(
+            (i for i, rule in enumerate(self._rules) if rule["id"] == self.selected_rule_id),
+            -1,
+        )
+        if row < 0:
+            self._load_data()
+            return
+        del self._rules[row]
+        # 移除選取列與清除選取都會觸發 itemSelectionChanged，這裡直接同步狀態即可
+        with QSignalBlocker(self.table_rules):
+            self.table_rules.removeRow(row)
+            self.table_rules.clearSelection()
+        self.selected_rule_id = None
 
     def _show_rule_context_menu(self, position) -> None:
         menu = QMenu(self)
@@ -250,28 +299,9 @@ class HolidaySettingsDialog(QDialog):
         if self.selected_rule_id is None:
             return None
         row = self.table_rules.currentRow()
-        if row < 0:
-            return None
-
-        item_calendar = self.table_rules.item(row, 1)
-        item_date = self.table_rules.item(row, 2)
-        if not item_calendar or not item_date:
-            return None
-
-        try:
-            month_str, day_str = item_date.text().strip().split("/")
-            month = int(month_str)
-            day = int(day_str)
-        except ValueError:
+        if not 0 <= row < len(self._rules):
             return None
-
-        calendar_type = "solar" if item_calendar.text().strip() == "國曆" else "lunar"
-        return {
-            "id": self.selected_rule_id,
-            "calendar_type": calendar_type,
-            "month": month,
-            "day": day,
-        }
+        return dict(self._rules[row])
 
     def _on_rule_selected(self) -> None:
         selected = self.table_rules.selectedItems()
@@ -280,19 +310,11 @@ class HolidaySettingsDialog(QDialog):
             return
 
         row = selected[0].row()
-        item_id = self.table_rules.item(row, 0)
-        item_calendar = self.table_rules.item(row, 1)
-        item_date = self.table_rules.item(row, 2)
-
-        if not item_id or not item_calendar or not item_date:
+        if not 0 <= row < len(self._rules):
             self.selected_rule_id = None
             return
 
-        try:
-            self.selected_rule_id = int(item_id.text())
-        except ValueError:
-            self.selected_rule_id = None
-            return
+        self.selected_rule_id = self._rules[row]["id"]
 
         # 僅同步 selected_rule_id；實際編輯由右鍵 popup 完成
         return
@@ -420,12 +442,12 @@ class HolidayRuleEditDialog(QDialog):
 
         row = QHBoxLayout()
         self.combo_calendar_type = QComboBox()
-        self.combo_calendar_type.addItem("國曆", "solar")
-        self.combo_calendar_type.addItem("農曆", "lunar")
+        for calendar_type_key, label in _CALENDAR_TYPE_LABELS.items():
+            self.combo_calendar_type.addItem(label, calendar_type_key)
 
         self.combo_month = QComboBox()
-        for m in range(1, 13):
-            self.combo_month.addItem(f"{m} 月", m)
+        for m, label in enumerate(_MONTH_ITEM_LABELS, start=1):
+            self.combo_month.addItem(label, m)
 
         self.combo_day = QComboBox()
 
@@ -442,7 +464,8 @@ class HolidayRuleEditDialog(QDialog):
         actions.addWidget(self.btn_cancel)
         root.addLayout(actions)
 
-        self.combo_month.currentIndexChanged.connect(self._reload_day_combo)
+        # currentIndexChanged 會帶入月份索引，不可當成 preferred_day，改為沿用目前選取的日
+        self.combo_month.currentIndexChanged.connect(lambda _index: self._reload_day_combo())
         self.btn_ok.clicked.connect(self.accept)
         self.btn_cancel.clicked.connect(self.reject)
 
@@ -451,11 +474,13 @@ class HolidayRuleEditDialog(QDialog):
         self._wheel_combo_targets: Dict[object, QComboBox] = {}
         self._register_combo_wheel_targets()
 
-        idx_calendar = self.combo_calendar_type.findData(calendar_type)
-        self.combo_calendar_type.setCurrentIndex(max(0, idx_calendar))
+        self.reset(calendar_type, month, day)
 
-        idx_month = self.combo_month.findData(month)
-        self.combo_month.setCurrentIndex(max(0, idx_month))
+    def reset(self, calendar_type: str = "solar", month: int = 1, day: int = 1) -> None:
+        """重新帶入初始值，讓同一個 popup 可重複用於新增與編輯。"""
+        # 選項依序排列（國曆/農曆、1~12 月、1~N 日），索引可直接由數值換算，不需 findData 逐項比對
+        self.combo_calendar_type.setCurrentIndex(1 if calendar_type == "lunar" else 0)
+        self.combo_month.setCurrentIndex(month - 1 if 1 <= month <= 12 else 0)
         self._reload_day_combo(day)
 
     def _register_combo_wheel_targets(self) -> None:
@@ -508,13 +533,15 @@ class HolidayRuleEditDialog(QDialog):
         elif month == 2:
             max_days = 29
 
-        self.combo_day.blockSignals(True)
-        self.combo_day.clear()
-        for d in range(1, max_days + 1):
-            self.combo_day.addItem(f"{d} 日", d)
-        idx_day = self.combo_day.findData(min(preferred_day, max_days))
-        self.combo_day.setCurrentIndex(max(0, idx_day))
-        self.combo_day.blockSignals(False)
+        with QSignalBlocker(self.combo_day):
+            # 只增減尾端差異的日數項目，不整個清空重建
+            count = self.combo_day.count()
+            while count > max_days:
+                count -= 1
+                self.combo_day.removeItem(count)
+            for d in range(count + 1, max_days + 1):
+                self.combo_day.addItem(_DAY_ITEM_LABELS[d - 1], d)
+            self.combo_day.setCurrentIndex(max(0, min(preferred_day, max_days) - 1))
 
     def get_values(self) -> Dict[str, int | str]:
         return {
@@ -1,11 +1,10 @@
 from __future__ import annotations
 
-from collections import defaultdict
 from datetime import date, timedelta
 from typing import Callable, Dict, List, Optional
 
 from PySide6.QtCore import QDate, Qt, Signal, QEvent
-from PySide6.QtGui import QCursor, QFont, QKeySequence, QShortcut
+from PySide6.QtGui import QAction, QCursor, QFont, QKeySequence, QShortcut
 from PySide6.QtWidgets import (
     QDialog,
     QDialogButtonBox,
@@ -18,7 +17,7 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from core.schedule_resolver import ResolvedOccurrence
+from core.schedule_resolver import ResolvedOccurrence, group_occurrences_by_date
 from core.lunar_calendar import to_lunar, format_lunar_day_text
 from ui.wheel_select_list import WheelSelectListWidget
 
@@ -29,6 +28,24 @@ def _month_grid_start(month_date: QDate) -> QDate:
     return first_day.addDays(-days_to_sunday)
 
 
+# 同一分類的行程常在整月重複出現，樣式字串依 (背景色, 文字色) 只組一次
+_chip_style_cache: Dict[tuple, str] = {}
+
+
+def _chip_style_sheet(bg: str, fg: str) -> str:
+    key = (bg, fg)
+    style = _chip_style_cache.get(key)
+    if style is None:
+        style = (
+            f"background-color: {bg};"
+            f"color: {fg};"
+            "border-radius: 8px;"
+            "padding: 2px 6px;"
+        )
+        _chip_style_cache[key] = style
+    return style
+
+
 class EventChipLabel(QLabel):
     event_double_clicked = Signal(object)
 
@@ -65,10 +82,18 @@ class MonthViewWidget(QWidget):
         self.selected_date = QDate.currentDate()
         self.occurrences: List[ResolvedOccurrence] = []
         self._holiday_checker: Optional[Callable[[QDate], bool]] = None
-        self._cell_dates: Dict[tuple[int, int], QDate] = {}
+        # 月格 42 天的日期，依 row * 7 + col 索引；只在月格起始日改變時重建
+        self._cell_dates: List[QDate] = []
+        self._grid_start_jd: Optional[int] = None
+        # 每格目前顯示內容的鍵值；鍵值相同時沿用既有的 cell widget，不重建
+        self._cell_keys: Dict[tuple[int, int], tuple] = {}
+        # 日期文字（含農曆）以 Julian day 快取，避免每次重建都重新換算農曆
+        self._date_text_cache: Dict[int, str] = {}
         self.time_scale_minutes = 60
         self._drag_state: Optional[Dict[str, object]] = None
         self._drag_preview_date: Optional[QDate] = None
+        self._context_menu: Optional[QMenu] = None
+        self._context_actions: Dict[QAction, str] = {}
 
         self.table = QTableWidget(6, 7)
         self.table.setEditTriggers(QTableWidget.NoEditTriggers)
@@ -116,11 +141,30 @@ class MonthViewWidget(QWidget):
         self._render()
 
     def set_selected_date(self, qdate: QDate):
+        previous = self.selected_date
         self.selected_date = qdate
-        self._render()
+        self._refresh_cells(previous, qdate)
 
     def set_occurrences(self, occurrences: List[ResolvedOccurrence]):
-        self.occurrences = occurrences
+        self._set_occurrences_grouped(occurrences, None)
+        self._render()
+
+    def set_view_state(
+        self,
+        reference_date: QDate,
+        selected_date: QDate,
+        occurrences: List[ResolvedOccurrence],
+        occurrences_by_date: Optional[Dict[date, List[ResolvedOccurrence]]] = None,
+    ):
+        """一次套用月份、選取日與行程，整個月格只重建一次。
+
+        occurrences_by_date 為呼叫端已用 group_occurrences_by_date 分好組的資料，
+        提供時直接沿用，不再重新分組。
+        """
+        self.reference_date = reference_date
+        self.selected_date = selected_date
+        if occurrences is not self.occurrences or occurrences_by_date is not None:
+            self._set_occurrences_grouped(occurrences, occurrences_by_date)
         self._render()
 
     def set_holiday_checker(self, checker: Optional[Callable[[QDate], bool]]):
@@ -137,16 +181,63 @@ class MonthViewWidget(QWidget):
         except Exception:
             return False
 
-    def _group_by_date(self) -> Dict[QDate, List[ResolvedOccurrence]]:
-        grouped: Dict[QDate, List[ResolvedOccurrence]] = defaultdict(list)
-        for occurrence in self.occurrences:
-            key = QDate(occurrence.start.year, occurrence.start.month, occurrence.start.day)
-            grouped[key].append(occurrence)
+    def _set_occurrences_grouped(
+        self,
+        occurrences: List[ResolvedOccurrence],
+        occurrences_by_date: Optional[Dict[date, List[ResolvedOccurrence]]],
+    ):
+        # 分組只在行程資料改變時做一次；切換月份或選取日只重繪，不重新分組
+        self.occurrences = occurrences
+        if occurrences_by_date is None:
+            occurrences_by_date = group_occurrences_by_date(sorted(occurrences, key=lambda item: item.start))
+        self._grouped_events = {
+            QDate(day.year, day.month, day.day): events for day, events in occurrences_by_date.items()
+        }
 
-        for date_key in grouped:
-            grouped[date_key].sort(key=lambda item: item.start)
+    def _date_text(self, qdate: QDate) -> str:
+        julian_day = qdate.toJulianDay()
+        text = self._date_text_cache.get(julian_day)
+        if text is not None:
+            return text
+
+        # 日期 + 農曆顯示（若有安裝農曆套件）
+        text = str(qdate.day())
+        lunar_text = ""
+        try:
+            info = to_lunar(date(qdate.year(), qdate.month(), qdate.day()))
+            if info:
+                lunar_text = format_lunar_day_text(info)
+        except Exception:
+            lunar_text = ""
 
-        return grouped
+        if lunar_text:
+            text = f"{qdate.day()} ({lunar_text})"
+        self._date_text_cache[julian_day] = text
+        return text
+
+    def _cell_key(self, qdate: QDate, events: List[ResolvedOccurrence]) -> tuple:
+        """cell widget 的外觀只取決於這些值；任一改變才需要重建。"""
+        return (
+            qdate.toJulianDay(),
+            qdate == self.selected_date,
+            self._drag_preview_date is not None and qdate == self._drag_preview_date,
+            qdate == QDate.currentDate(),
+            qdate.month() == self.reference_date.month(),
+            self._is_holiday(qdate),
+            self.palette().window().color().lightness() < 128,
+            tuple(
+                (
+                    occ.schedule_id,
+                    occ.title,
+                    occ.start,
+                    occ.end,
+                    occ.category_bg,
+                    occ.category_fg,
+                    occ.target_value,
+                )
+                for occ in events
+            ),
+        )
 
     def _build_cell_widget(self, qdate: QDate, events: List[ResolvedOccurrence]) -> QWidget:
         container = QWidget()
@@ -176,20 +267,7 @@ class MonthViewWidget(QWidget):
         layout.setContentsMargins(4, 4, 4, 4)
         layout.setSpacing(3)
 
-        # 日期 + 農曆顯示（若有安裝農曆套件）
-        text = str(qdate.day())
-        lunar_text = ""
-        try:
-            info = to_lunar(date(qdate.year(), qdate.month(), qdate.day()))
-            if info:
-                lunar_text = format_lunar_day_text(info)
-        except Exception:
-            lunar_text = ""
-
-        if lunar_text:
-            text = f"{qdate.day()} ({lunar_text})"
-
-        date_label = QLabel(text)
+        date_label = QLabel(self._date_text(qdate))
         if qdate.month() != self.reference_date.month():
             cross_month_color = "#b36b6b" if is_holiday else "#808080"
             date_label.setStyleSheet(f"font-weight: bold; color: {cross_month_color};")
@@ -219,7 +297,7 @@ class MonthViewWidget(QWidget):
             )
             merged_label.setToolTip(
                 "\n".join(
-                    f"{occ.title} ({occ.start.strftime('%H:%M')} - {occ.end.strftime('%H:%M')})"
+                    f"{occ.title} ({occ.time_range_text()})"
                     for occ in events
                 )
             )
@@ -230,15 +308,10 @@ class MonthViewWidget(QWidget):
         else:
             for occurrence in events:
                 chip = EventChipLabel(occurrence, occurrence.title)
-                chip.setStyleSheet(
-                    f"background-color: {occurrence.category_bg};"
-                    f"color: {occurrence.category_fg};"
-                    "border-radius: 8px;"
-                    "padding: 2px 6px;"
-                )
+                chip.setStyleSheet(_chip_style_sheet(occurrence.category_bg, occurrence.category_fg))
                 chip.setToolTip(
                     f"{occurrence.title}\n"
-                    f"{occurrence.start.strftime('%H:%M')} - {occurrence.end.strftime('%H:%M')}\n"
+                    f"{occurrence.time_range_text()}\n"
                     f"{occurrence.target_value}"
                 )
                 chip.event_double_clicked.connect(
@@ -249,28 +322,53 @@ class MonthViewWidget(QWidget):
         layout.addStretch()
         return container
 
-    def _render(self):
-        grouped = self._group_by_date()
-        self._grouped_events = grouped
-        self._cell_dates.clear()
+    def _update_cell(self, row: int, col: int, qdate: QDate):
+        events = self._grouped_events.get(qdate, [])
+        key = self._cell_key(qdate, events)
+        if self._cell_keys.get((row, col)) == key and self.table.cellWidget(row, col) is not None:
+            return
+        self._cell_keys[(row, col)] = key
+        self.table.setCellWidget(row, col, self._build_cell_widget(qdate, events))
 
-        start = _month_grid_start(self.reference_date)
+    def _date_at(self, row: int, col: int) -> Optional[QDate]:
+        if 0 <= row < 6 and 0 <= col < 7 and self._cell_dates:
+            return self._cell_dates[row * 7 + col]
+        return None
 
-        for row in range(6):
-            for col in range(7):
-                qdate = start.addDays(row * 7 + col)
-                self._cell_dates[(row, col)] = qdate
-                events = grouped.get(qdate, [])
-                self.table.setCellWidget(row, col, self._build_cell_widget(qdate, events))
+    def _cell_for_date(self, qdate: QDate) -> Optional[tuple[int, int]]:
+        # 月格日期連續，直接由 Julian day 的差值算出格子位置
+        if self._grid_start_jd is None:
+            return None
+        offset = qdate.toJulianDay() - self._grid_start_jd
+        if 0 <= offset < 42:
+            return divmod(offset, 7)
+        return None
+
+    def _refresh_cells(self, *dates: Optional[QDate]):
+        """只重建指定日期所在的格子（不在目前月格內的日期略過）。"""
+        for qdate in dates:
+            if qdate is None:
+                continue
+            cell = self._cell_for_date(qdate)
+            if cell is not None:
+                self._update_cell(cell[0], cell[1], qdate)
+
+    def _render(self):
+        start_jd = _month_grid_start(self.reference_date).toJulianDay()
+        if start_jd != self._grid_start_jd:
+            self._grid_start_jd = start_jd
+            self._cell_dates = [QDate.fromJulianDay(start_jd + offset) for offset in range(42)]
+
+        for offset, qdate in enumerate(self._cell_dates):
+            self._update_cell(offset // 7, offset % 7, qdate)
 
     def _on_cell_clicked(self, row: int, col: int):
-        qdate = self._cell_dates.get((row, col))
+        qdate = self._date_at(row, col)
         if qdate is None:
             return
 
-        self.selected_date = qdate
+        self.set_selected_date(qdate)
         self.date_selected.emit(qdate)
-        self._render()
 
     def _set_month_cursor(self, mode: Optional[str]):
         viewport = self.table.viewport()
@@ -286,8 +384,9 @@ class MonthViewWidget(QWidget):
             return
         if qdate is not None and self._drag_preview_date is not None and qdate == self._drag_preview_date:
             return
+        previous = self._drag_preview_date
         self._drag_preview_date = qdate
-        self._render()
+        self._refresh_cells(previous, qdate)
 
     def _cell_mode_for_position(self, index, pos) -> str:
         rect = self.table.visualRect(index)
@@ -304,7 +403,7 @@ class MonthViewWidget(QWidget):
             self._set_month_cursor(None)
             return
 
-        qdate = self._cell_dates.get((index.row(), index.column()))
+        qdate = self._date_at(index.row(), index.column())
         if qdate is None:
             self._set_month_cursor(None)
             return
@@ -329,7 +428,9 @@ class MonthViewWidget(QWidget):
             return
         index = self.table.indexAt(release_pos)
         if index.isValid():
-            target_date = self._cell_dates.get((index.row(), index.column()), state["source_date"])
+            target_date = self._date_at(index.row(), index.column())
+            if target_date is None:
+                target_date = state["source_date"]
         else:
             target_date = state["source_date"]
 
@@ -376,13 +477,12 @@ class MonthViewWidget(QWidget):
         if watched is self.table and event.type() == QEvent.KeyPress:
             index = self.table.currentIndex()
             if not index.isValid():
-                for (row, col), qdate in self._cell_dates.items():
-                    if qdate == self.selected_date:
-                        index = self.table.model().index(row, col)
-                        break
+                cell = self._cell_for_date(self.selected_date)
+                if cell is not None:
+                    index = self.table.model().index(cell[0], cell[1])
 
             if index.isValid():
-                qdate = self._cell_dates.get((index.row(), index.column()))
+                qdate = self._date_at(index.row(), index.column())
                 if qdate is not None:
                     key = event.key()
                     mods = event.modifiers()
@@ -404,7 +504,7 @@ class MonthViewWidget(QWidget):
             if event.type() == QEvent.MouseButtonPress and event.button() == Qt.LeftButton:
                 index = self.table.indexAt(event.pos())
                 if index.isValid():
-                    qdate = self._cell_dates.get((index.row(), index.column()))
+                    qdate = self._date_at(index.row(), index.column())
                     if qdate is not None:
                         events = self._grouped_events.get(qdate, [])
                         if events:
@@ -453,7 +553,7 @@ class MonthViewWidget(QWidget):
                     mode = str(self._drag_state.get("mode", "move"))
                     index = self.table.indexAt(event.pos())
                     if index.isValid():
-                        target_date = self._cell_dates.get((index.row(), index.column()))
+                        target_date = self._date_at(index.row(), index.column())
                     else:
                         target_date = self._drag_state.get("source_date")
                     if isinstance(target_date, QDate):
@@ -568,7 +668,7 @@ class MonthViewWidget(QWidget):
         options: List[str] = []
         for idx, occ in enumerate(events, start=1):
             label = (
-                f"{occ.title} ({occ.start.strftime('%H:%M')} - {occ.end.strftime('%H:%M')}) "
+                f"{occ.title} ({occ.time_range_text()}) "
                 f"[ID:{occ.schedule_id}]"
             )
             if label in option_map:
@@ -623,64 +723,52 @@ class MonthViewWidget(QWidget):
         targets = [option_map[label] for label in labels if label in option_map]
         return targets or None
 
+    def _ensure_context_menu(self) -> QMenu:
+        # 右鍵選單只建立一次，之後每次只更新啟用狀態
+        if self._context_menu is None:
+            menu = QMenu(self)
+            self._context_actions = {
+                menu.addAction("新增行程 (New)"): "new",
+                menu.addAction("複製行程 (Copy)"): "copy",
+                menu.addAction("貼上行程 (Paste)"): "paste",
+                menu.addAction("刪除行程 (Delete)"): "delete",
+            }
+            self._context_menu = menu
+        return self._context_menu
+
     def _show_context_menu(self, position):
         index = self.table.indexAt(position)
         if not index.isValid():
             return
 
-        row = index.row()
-        col = index.column()
-        qdate = self._cell_dates.get((row, col))
+        qdate = self._date_at(index.row(), index.column())
         if qdate is None:
             return
 
         events = self._grouped_events.get(qdate, [])
         first_event = events[0] if events else None
 
-        payload = {
-            "schedule_id": first_event.schedule_id if first_event else None,
-            "date": qdate.toString("yyyy-MM-dd"),
-            "hour": first_event.start.hour if first_event else 8,
-            "minute": first_event.start.minute if first_event else 0,
-            "week_mode": False,
-            "month_mode": True,
-        }
-
-        menu = QMenu(self)
-        new_action = menu.addAction("新增行程 (New)")
-        copy_action = menu.addAction("複製行程 (Copy)")
-        paste_action = menu.addAction("貼上行程 (Paste)")
-        delete_action = menu.addAction("刪除行程 (Delete)")
-
+        menu = self._ensure_context_menu()
         has_event = first_event is not None
-        delete_action.setEnabled(has_event)
-        copy_action.setEnabled(has_event)
+        for action, action_name in self._context_actions.items():
+            action.setEnabled(has_event or action_name in ("new", "paste"))
 
         selected_action = menu.exec(self.table.viewport().mapToGlobal(position))
-        if selected_action is None:
+        action_name = self._context_actions.get(selected_action)
+        if action_name is None:
             return
 
-        if selected_action == new_action:
+        if action_name == "new":
+            payload = {
+                "schedule_id": first_event.schedule_id if first_event else None,
+                "date": qdate.toString("yyyy-MM-dd"),
+                "hour": first_event.start.hour if first_event else 8,
+                "minute": first_event.start.minute if first_event else 0,
+                "week_mode": False,
+                "month_mode": True,
+            }
             self.context_action_requested.emit("new", payload)
-        elif selected_action == copy_action:
-            targets = self._pick_events(qdate, events, "複製", allow_multi=True)
-            if not targets:
-                return
-            first = targets[0]
-            payload["schedule_id"] = first.schedule_id
-            payload["schedule_ids"] = [t.schedule_id for t in targets]
-            payload["hour"] = first.start.hour
-            payload["minute"] = first.start.minute
-            self.context_action_requested.emit("copy", payload)
-        elif selected_action == paste_action:
-            self.context_action_requested.emit("paste", payload)
-        elif selected_action == delete_action:
-            targets = self._pick_events(qdate, events, "刪除", allow_multi=True)
-            if not targets:
-                return
-            first = targets[0]
-            payload["schedule_id"] = first.schedule_id
-            payload["schedule_ids"] = [t.schedule_id for t in targets]
-            payload["hour"] = first.start.hour
-            payload["minute"] = first.start.minute
-            self.context_action_requested.emit("delete", payload)
+            return
+
+        # 複製 / 貼上 / 刪除與鍵盤快捷鍵走同一套流程
+        self._trigger_action_for_date(action_name, qdate)
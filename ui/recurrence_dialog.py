@@ -314,8 +314,8 @@ class DropdownNavCalendar(QCalendarWidget):
 
         self._ensure_year_available(year)
 
-        year_index = self.combo_year.findData(year)
-        month_index = self.combo_month.findData(month)
+        year_index = self._year_index(year)
+        month_index = month - 1 if 1 <= month <= self.combo_month.count() else -1
 
         self.combo_year.blockSignals(True)
         self.combo_month.blockSignals(True)
@@ -341,18 +341,26 @@ class DropdownNavCalendar(QCalendarWidget):
         for y in years:
             self.combo_year.addItem(str(y), y)
 
-        idx = self.combo_year.findData(target_year)
+        idx = self._year_index(target_year)
         if idx >= 0:
             self.combo_year.setCurrentIndex(idx)
         self.combo_year.blockSignals(False)
 
+    def _year_index(self, year: int) -> int:
+        """年份選項固定為連續年份，由第一項直接推算索引，不逐項 findData 比對。"""
+        count = self.combo_year.count()
+        if count == 0:
+            return -1
+        index = year - int(self.combo_year.itemData(0))
+        return index if 0 <= index < count else -1
+
     def _ensure_year_available(self, year: int) -> int:
-        idx = self.combo_year.findData(year)
+        idx = self._year_index(year)
         if idx >= 0:
             return idx
 
         self._set_year_window(year, year)
-        return self.combo_year.findData(year)
+        return self._year_index(year)
 
     def _shift_year_window_by_steps(self, steps: int):
         if steps == 0:
@@ -426,9 +434,10 @@ class PopupDateEdit(QDateEdit):
         self.setButtonSymbols(QAbstractSpinBox.NoButtons)
         self.setReadOnly(True)
         self.setCursor(Qt.PointingHandCursor)
-        self._calendar_popup = DropdownNavCalendar(self)
-        self._calendar_popup.setWindowFlags(Qt.Popup)
-        self._calendar_popup.clicked.connect(self._on_calendar_date_clicked)
+        # 月曆彈窗第一次點擊時才建立，對話框開啟時不必先建構兩個 QCalendarWidget
+        self._calendar_popup = None
+        self._popup_holiday_checker = None
+        self._popup_is_dark = False
         self.setStyleSheet(
             """
             QDateEdit::drop-down {
@@ -468,12 +477,32 @@ class PopupDateEdit(QDateEdit):
             return True
         return super().eventFilter(obj, event)
 
+    def set_holiday_checker(self, checker):
+        self._popup_holiday_checker = checker
+        if self._calendar_popup is not None:
+            self._calendar_popup.set_holiday_checker(checker)
+
+    def apply_theme(self, is_dark: bool):
+        self._popup_is_dark = bool(is_dark)
+        if self._calendar_popup is not None:
+            self._calendar_popup.apply_theme(self._popup_is_dark)
+
+    def _ensure_calendar_popup(self) -> "DropdownNavCalendar":
+        if self._calendar_popup is None:
+            calendar = DropdownNavCalendar(self)
+            calendar.setWindowFlags(Qt.Popup)
+            calendar.clicked.connect(self._on_calendar_date_clicked)
+            if self._popup_is_dark:
+                calendar.apply_theme(True)
+            if self._popup_holiday_checker is not None:
+                calendar.set_holiday_checker(self._popup_holiday_checker)
+            self._calendar_popup = calendar
+        return self._calendar_popup
+
     def _show_calendar_popup(self):
         if not self.isEnabled():
             return
-        calendar = self._calendar_popup
-        if calendar is None:
-            return
+        calendar = self._ensure_calendar_popup()
         calendar.setSelectedDate(self.date())
         min_width = 280
         min_height = 270
@@ -725,10 +754,10 @@ class RecurrenceDialog(QDialog):
             return False
 
     def _apply_popup_holiday_checkers(self):
-        if hasattr(self, "start_date_edit") and hasattr(self.start_date_edit, "_calendar_popup"):
-            self.start_date_edit._calendar_popup.set_holiday_checker(self._is_holiday_qdate)
-        if hasattr(self, "end_date_edit") and hasattr(self.end_date_edit, "_calendar_popup"):
-            self.end_date_edit._calendar_popup.set_holiday_checker(self._is_holiday_qdate)
+        if hasattr(self, "start_date_edit"):
+            self.start_date_edit.set_holiday_checker(self._is_holiday_qdate)
+        if hasattr(self, "end_date_edit"):
+            self.end_date_edit.set_holiday_checker(self._is_holiday_qdate)
 
     def apply_new_schedule_defaults(self):
         """新增排程時套用預設值。"""
@@ -1066,10 +1095,10 @@ class RecurrenceDialog(QDialog):
         if self.end_time_combo.lineEdit() is not None:
             self.end_time_combo.lineEdit().editingFinished.connect(self.on_end_time_changed)
         self.duration_combo.currentIndexChanged.connect(self.on_duration_changed)
-        # 支援使用者直接在可編輯的 combo 中輸入自訂期間
+        # 支援使用者直接在可編輯的 combo 中輸入自訂期間；只在 editingFinished 時解析，
+        # 不連接 textChanged，避免每次按鍵（與程式設定選項時）都進入 Python slot
         if self.duration_combo.isEditable() and self.duration_combo.lineEdit() is not None:
             self.duration_combo.lineEdit().editingFinished.connect(self.on_duration_text_edited)
-            self.duration_combo.lineEdit().textChanged.connect(self.on_duration_text_changed)
 
         combo_targets = [self.start_time_combo, self.end_time_combo, self.duration_combo]
         for combo in combo_targets:
@@ -1157,22 +1186,12 @@ class RecurrenceDialog(QDialog):
 
             # 設置開始日期（優先使用 RRULE 的 DTSTART）
             range_start_raw = params.get("X-RANGE-START", "")
-            if range_start_raw and len(range_start_raw) >= 8:
-                try:
-                    year = int(range_start_raw[:4])
-                    month = int(range_start_raw[4:6])
-                    day = int(range_start_raw[6:8])
-                    self.start_date_edit.setDate(QDate(year, month, day))
-                except (ValueError, IndexError):
-                    pass
-            elif dtstart_raw and len(dtstart_raw) >= 8:
-                try:
-                    year = int(dtstart_raw[:4])
-                    month = int(dtstart_raw[4:6])
-                    day = int(dtstart_raw[6:8])
-                    self.start_date_edit.setDate(QDate(year, month, day))
-                except (ValueError, IndexError):
-                    pass
+            # YYYYMMDD 直接交給 QDate.fromString 解析，格式不符時為 invalid 不套用
+            start_raw = range_start_raw if range_start_raw and len(range_start_raw) >= 8 else dtstart_raw
+            if start_raw and len(start_raw) >= 8:
+                start_qdate = QDate.fromString(start_raw[:8], "yyyyMMdd")
+                if start_qdate.isValid():
+                    self.start_date_edit.setDate(start_qdate)
 
             # 設置開始時間
             # 編輯既有排程時，優先使用 RRULE 已儲存時間；僅在 RRULE 無時間時才回退到 initial_time
@@ -1213,15 +1232,10 @@ class RecurrenceDialog(QDialog):
                 self.end_count.setValue(int(params["COUNT"]))
             elif "UNTIL" in params:
                 self.radio_end_by.setChecked(True)
-                until_str = params["UNTIL"]
-                try:
-                    # 解析 UNTIL 日期 (格式: YYYYMMDD)
-                    year = int(until_str[:4])
-                    month = int(until_str[4:6])
-                    day = int(until_str[6:8])
-                    self.end_date_edit.setDate(QDate(year, month, day))
-                except (ValueError, IndexError):
-                    pass  # 使用預設值
+                # 解析 UNTIL 日期 (格式: YYYYMMDD)，無效時使用預設值
+                until_qdate = QDate.fromString(params["UNTIL"][:8], "yyyyMMdd")
+                if until_qdate.isValid():
+                    self.end_date_edit.setDate(until_qdate)
             else:
                 self.radio_end_never.setChecked(True)
 
@@ -1866,11 +1880,6 @@ class RecurrenceDialog(QDialog):
             finally:
                 self._updating_times = False
 
-    def on_duration_text_changed(self, text: str):
-        """在使用者輸入期間文字時，提供即時的輸入驗證（不立即套用）"""
-        # 目前不強制更新結束時間，等 editingFinished 再處理
-        return
-
     def on_duration_text_edited(self):
         """使用者在可編輯的 combo 完成輸入後，解析並套用期間"""
         text = self.duration_combo.currentText()
@@ -2394,10 +2403,10 @@ class RecurrenceDialog(QDialog):
                 }
             """)
 
-        if hasattr(self, "start_date_edit") and hasattr(self.start_date_edit, "_calendar_popup"):
-            self.start_date_edit._calendar_popup.apply_theme(is_dark)
-        if hasattr(self, "end_date_edit") and hasattr(self.end_date_edit, "_calendar_popup"):
-            self.end_date_edit._calendar_popup.apply_theme(is_dark)
+        if hasattr(self, "start_date_edit"):
+            self.start_date_edit.apply_theme(is_dark)
+        if hasattr(self, "end_date_edit"):
+            self.end_date_edit.apply_theme(is_dark)
         self._apply_time_guide_label_style()
 
     def get_rrule(self) -> str:
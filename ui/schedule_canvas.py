@@ -22,6 +22,22 @@ from core.schedule_resolver import ResolvedOccurrence
 from ui.wheel_select_list import WheelSelectListWidget
 
 
+# 同格多筆任務統一使用的深青底白字
+_MULTI_OCCURRENCE_BG = QColor("#0f766e")
+_MULTI_OCCURRENCE_FG = QColor("#ffffff")
+# 類別色只有少數幾種，依色碼重複使用同一個 QColor
+_COLOR_CACHE: dict[str, QColor] = {}
+# 週檢視表頭（自週日起）
+_WEEK_DAY_NAMES = ("週日", "週一", "週二", "週三", "週四", "週五", "週六")
+
+
+def _cached_color(name: str) -> QColor:
+    color = _COLOR_CACHE.get(name)
+    if color is None:
+        color = _COLOR_CACHE[name] = QColor(name)
+    return color
+
+
 def _hour_label(hour: int) -> str:
     if hour == 0:
         return "上午 12:00"
@@ -260,12 +276,11 @@ class ScheduleTimeGridWidget(QWidget):
             return
 
         sunday = _week_start_sunday(self.reference_date)
-        day_names = ["週日", "週一", "週二", "週三", "週四", "週五", "週六"]
         selected_col = max(0, min(6, sunday.daysTo(self.reference_date)))
         labels = []
         for offset in range(7):
             day = sunday.addDays(offset)
-            labels.append(f"{day_names[offset]} {day.day()}")
+            labels.append(f"{_WEEK_DAY_NAMES[offset]} {day.day()}")
         self.table.setHorizontalHeaderLabels(labels)
         if isinstance(header, SelectedDayHeaderView):
             header.set_selected_column(selected_col)
@@ -312,19 +327,10 @@ class ScheduleTimeGridWidget(QWidget):
                 item.setForeground(empty_fg)
                 item.setToolTip("")
 
-    def _column_for_date(self, dt: datetime) -> int:
-        if not self.week_mode:
-            return 0
-
-        sunday = _week_start_sunday(self.reference_date)
-        target = QDate(dt.year, dt.month, dt.day)
-        return sunday.daysTo(target)
-
-    def _render_occurrence(self, occurrence: ResolvedOccurrence):
+    def _render_occurrence(self, occurrence: ResolvedOccurrence, col: int):
         start = occurrence.start
         end = occurrence.end
 
-        col = self._column_for_date(start)
         if col < 0 or col >= self.table.columnCount():
             return
 
@@ -645,17 +651,17 @@ class ScheduleTimeGridWidget(QWidget):
 
         if len(occurrences) == 1:
             occ = occurrences[0]
-            item.setBackground(QColor(occ.category_bg))
-            item.setForeground(QColor(occ.category_fg))
+            item.setBackground(_cached_color(occ.category_bg))
+            item.setForeground(_cached_color(occ.category_fg))
         else:
             # 同一時間格有多筆任務時，使用統一深青底白字
-            item.setBackground(QColor("#0f766e"))
-            item.setForeground(QColor("#ffffff"))
+            item.setBackground(_MULTI_OCCURRENCE_BG)
+            item.setForeground(_MULTI_OCCURRENCE_FG)
 
         tooltip_lines = []
         for occ in occurrences:
             tooltip_lines.append(
-                f"{occ.title} ({occ.start.strftime('%H:%M')} - {occ.end.strftime('%H:%M')})"
+                f"{occ.title} ({occ.time_range_text()})"
             )
         item.setToolTip("\n".join(tooltip_lines))
 
@@ -674,7 +680,7 @@ class ScheduleTimeGridWidget(QWidget):
         option_map: dict[str, ResolvedOccurrence] = {}
         for idx, occ in enumerate(occurrences, start=1):
             label = (
-                f"{occ.title} ({occ.start.strftime('%H:%M')} - {occ.end.strftime('%H:%M')}) "
+                f"{occ.title} ({occ.time_range_text()}) "
                 f"[ID:{occ.schedule_id}]"
             )
             if label in option_map:
@@ -932,13 +938,17 @@ class ScheduleTimeGridWidget(QWidget):
         self._ensure_items()
         self._clear_grid()
 
+        # 起始日只換算一次成 Python date，每筆 occurrence 以原生 date 相減求欄位，不必逐筆建立 QDate
+        if self.week_mode:
+            first_day = _week_start_sunday(self.reference_date).toPython()
+        else:
+            first_day = self.reference_date.toPython()
+
         for occurrence in self.occurrences:
-            if self.week_mode:
-                self._render_occurrence(occurrence)
-            else:
-                occurrence_date = QDate(occurrence.start.year, occurrence.start.month, occurrence.start.day)
-                if occurrence_date == self.reference_date:
-                    self._render_occurrence(occurrence)
+            col = (occurrence.start.date() - first_day).days
+            if not self.week_mode and col != 0:
+                continue
+            self._render_occurrence(occurrence, col)
 
 class DayViewWidget(ScheduleTimeGridWidget):
     def __init__(self, parent=None):